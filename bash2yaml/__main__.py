@@ -285,6 +285,17 @@ def copy2local_handler(args: argparse.Namespace) -> int:
     return 0
 
 
+def _positive_float(value: str) -> float:
+    """Parse a CLI float that must be greater than 0."""
+    try:
+        number = float(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}") from e
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
 def compile_handler(args: argparse.Namespace) -> int:
     """Handler for the 'compile' command."""
     logger.info("Starting bash2yaml compiler...")
@@ -301,11 +312,15 @@ def compile_handler(args: argparse.Namespace) -> int:
         sys.exit(ExitCode.UNINSTALLED_DEPENDENCIES)
 
     if args.watch:
+        poll_interval = getattr(args, "poll_interval", None)
+        if poll_interval is None:
+            poll_interval = config.compile_poll_interval
         start_watch(
             input_dir=in_dir,
             output_path=out_dir,
             dry_run=dry_run,
             parallelism=parallelism,
+            poll_interval=poll_interval,
         )
         return 0
 
@@ -586,6 +601,12 @@ def main() -> int:
         action="store_true",
         help="Watch source directories and auto-recompile on changes.",
     )
+    compile_parser.add_argument(
+        "--poll-interval",
+        type=_positive_float,
+        default=None,
+        help="With --watch, poll every N seconds instead of using native file events.",
+    )
     compile_parser.add_argument(
         "--force", action="store_true", help="Force compilation even if no input changes detected"
     )
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import io
 import logging
 import multiprocessing
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from ruamel.yaml import CommentedMap, CommentedSeq
 from ruamel.yaml.comments import TaggedScalar
@@ -181,6 +183,8 @@ def process_script_list(
     contains_anchors_or_tags = False
 
     scripts_found = []
+    # Resolved once per block rather than once per line.
+    hook = get_pm().hook
     for item in items:
         # Non-plain strings: preserve and mark that YAML features exist
         if not isinstance(item, str):
@@ -194,8 +198,7 @@ def process_script_list(
             continue
 
         # Plain string: attempt to detect and inline scripts
-        pm = get_pm()
-        script_path_str = pm.hook.extract_script_path(line=item) or None
+        script_path_str = hook.extract_script_path(line=item) or None
         if script_path_str is None:
             # try existing extract_script_path fallback
             script_path_str = extract_script_path(item)
@@ -236,7 +239,7 @@ def process_script_list(
                 processed_items.extend(artifact_inline)
             else:
                 # NEW: interpreter-based script inlining (python/node/ruby/php/fish)
-                interp_inline, script_path_str_other = pm.hook.inline_command(line=item, scripts_root=scripts_root) or (
+                interp_inline, script_path_str_other = hook.inline_command(line=item, scripts_root=scripts_root) or (
                     None,
                     None,
                 )
@@ -457,6 +460,43 @@ def write_yaml_and_hash(
     logger.debug(f"Updated hash file: {short_path(hash_file)}")
 
 
+# Outputs this process last wrote or verified, keyed by output path:
+# (output (mtime_ns, size), hash file (mtime_ns, size), digest of the output text).
+# In watch mode the same outputs are checked on every rebuild; if neither file
+# has been touched since, the manual-edit check (two YAML parses) can be skipped.
+_KNOWN_OUTPUTS: dict[Path, tuple[tuple[int, int], tuple[int, int], bytes]] = {}
+
+
+def _stat_key(path: Path) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _digest(content: str) -> bytes:
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def _remember_output(output_file: Path, hash_file: Path, content: str) -> None:
+    """Record that ``output_file`` holds ``content`` and matches ``hash_file``."""
+    try:
+        _KNOWN_OUTPUTS[output_file] = (_stat_key(output_file), _stat_key(hash_file), _digest(content))
+    except OSError:
+        _KNOWN_OUTPUTS.pop(output_file, None)
+
+
+def _is_known_output(output_file: Path, hash_file: Path, content: str) -> bool:
+    """True if both files are untouched since ``_remember_output`` and the text still matches."""
+    known = _KNOWN_OUTPUTS.get(output_file)
+    if known is None:
+        return False
+    try:
+        if known[0] != _stat_key(output_file) or known[1] != _stat_key(hash_file):
+            return False
+    except OSError:
+        return False
+    return known[2] == _digest(content)
+
+
 def write_compiled_file(output_file: Path, new_content: str, output_base: Path, dry_run: bool = False) -> bool:
     """
     Writes a compiled file safely. If the destination file was manually edited in a meaningful way
@@ -495,6 +535,7 @@ def write_compiled_file(output_file: Path, new_content: str, output_base: Path,
     if not output_file.exists():
         logger.info(f"Output file {short_path(output_file)} does not exist. Creating.")
         write_yaml_and_hash(output_file, new_content, hash_file)
+        _remember_output(output_file, hash_file, output_file.read_text(encoding="utf-8"))
         return True
 
     # --- File exists, find its hash file (old or new location) ---
@@ -504,57 +545,59 @@ def write_compiled_file(output_file: Path, new_content: str, output_base: Path,
         logger.error(error_message)
         raise CompileError()
 
-    # Decode the last known content from the existing hash file
-    last_known_base64 = existing_hash.read_text(encoding="utf-8").strip()
-    try:
-        last_known_content = base64.b64decode(last_known_base64).decode("utf-8")
-    except (ValueError, TypeError) as e:
-        error_message = f"ERROR: Could not decode the .hash file for '{short_path(output_file)}'. It may be corrupted.\nError: {e}\nAborting to prevent data loss. Please remove the file and its .hash file to regenerate."
-        logger.error(error_message)
-        raise CompileError() from e
-
     current_content = output_file.read_text(encoding="utf-8")
 
-    # Load both YAML versions to compare their data structures
-    yaml = get_yaml()
-    try:
-        last_known_doc = yaml.load(last_known_content)
-    except YAMLError as e:
-        logger.error(
-            "ERROR: Could not parse YAML from the .hash file for '%s'. It is corrupted. Error: %s",
-            short_path(output_file),
-            e,
-        )
-        raise CompileError() from e
+    # Skip the manual-edit check if we wrote or verified this exact file earlier in this process.
+    if not _is_known_output(output_file, existing_hash, current_content):
+        # Decode the last known content from the existing hash file
+        last_known_base64 = existing_hash.read_text(encoding="utf-8").strip()
+        try:
+            last_known_content = base64.b64decode(last_known_base64).decode("utf-8")
+        except (ValueError, TypeError) as e:
+            error_message = f"ERROR: Could not decode the .hash file for '{short_path(output_file)}'. It may be corrupted.\nError: {e}\nAborting to prevent data loss. Please remove the file and its .hash file to regenerate."
+            logger.error(error_message)
+            raise CompileError() from e
+
+        # Load both YAML versions to compare their data structures
+        yaml = get_yaml()
+        try:
+            last_known_doc = yaml.load(last_known_content)
+        except YAMLError as e:
+            logger.error(
+                "ERROR: Could not parse YAML from the .hash file for '%s'. It is corrupted. Error: %s",
+                short_path(output_file),
+                e,
+            )
+            raise CompileError() from e
 
-    try:
-        current_doc = yaml.load(current_content)
-        is_current_corrupt = False
-    except YAMLError:
-        current_doc = None
-        is_current_corrupt = True
-        logger.warning("Could not parse YAML from '%s'; it appears to be corrupt.", short_path(output_file))
+        try:
+            current_doc = yaml.load(current_content)
+            is_current_corrupt = False
+        except YAMLError:
+            current_doc = None
+            is_current_corrupt = True
+            logger.warning("Could not parse YAML from '%s'; it appears to be corrupt.", short_path(output_file))
 
-    # An edit is detected if the current file is corrupt OR the parsed YAML documents are not identical.
-    is_same = yaml_is_same(last_known_content, current_content)
+        # An edit is detected if the current file is corrupt OR the parsed YAML documents are not identical.
+        is_same = yaml_is_same(last_known_content, current_content)
 
-    if is_current_corrupt or (current_doc != last_known_doc and not is_same):
-        diff_text = diff_helpers.unified_diff(
-            normalize_for_compare(last_known_content),
-            normalize_for_compare(current_content),
-            output_file,
-            "last known good",
-            "current",
-        )
-        corruption_warning = (
-            "The file is also syntactically invalid YAML, which is why it could not be processed.\n\n"
-            if is_current_corrupt
-            else ""
-        )
+        if is_current_corrupt or (current_doc != last_known_doc and not is_same):
+            diff_text = diff_helpers.unified_diff(
+                normalize_for_compare(last_known_content),
+                normalize_for_compare(current_content),
+                output_file,
+                "last known good",
+                "current",
+            )
+            corruption_warning = (
+                "The file is also syntactically invalid YAML, which is why it could not be processed.\n\n"
+                if is_current_corrupt
+                else ""
+            )
 
-        error_message = f"\n--- MANUAL EDIT DETECTED ---\nCANNOT OVERWRITE: The destination file below has been modified:\n  {output_file}\n\n{corruption_warning}The script detected that its data no longer matches the last generated version.\nTo prevent data loss, the process has been stopped.\n\n--- DETECTED CHANGES ---\n{diff_text if diff_text else 'No visual differences found, but YAML data structure has changed.'}\n--- HOW TO RESOLVE ---\n1. Revert the manual changes in '{output_file}' and run this script again.\nOR\n2. If the manual changes are desired, incorporate them into the source files\n   (e.g., the .sh or uncompiled .yml files), then delete the generated file\n   ('{output_file}') and its '.hash' file ('{existing_hash}') to allow the script\n   to regenerate it from the new base.\n"
-        print(error_message)
-        raise CompileError()
+            error_message = f"\n--- MANUAL EDIT DETECTED ---\nCANNOT OVERWRITE: The destination file below has been modified:\n  {output_file}\n\n{corruption_warning}The script detected that its data no longer matches the last generated version.\nTo prevent data loss, the process has been stopped.\n\n--- DETECTED CHANGES ---\n{diff_text if diff_text else 'No visual differences found, but YAML data structure has changed.'}\n--- HOW TO RESOLVE ---\n1. Revert the manual changes in '{output_file}' and run this script again.\nOR\n2. If the manual changes are desired, incorporate them into the source files\n   (e.g., the .sh or uncompiled .yml files), then delete the generated file\n   ('{output_file}') and its '.hash' file ('{existing_hash}') to allow the script\n   to regenerate it from the new base.\n"
+            print(error_message)
+            raise CompileError()
 
     # If we reach here, the current file is valid (or just reformatted).
     # Now, we check if the *newly generated* content is different from the current content.
@@ -574,9 +617,11 @@ def write_compiled_file(output_file: Path, new_content: str, output_base: Path,
         logger.debug(diff_text)
 
         write_yaml_and_hash(output_file, new_content, hash_file)
+        _remember_output(output_file, hash_file, output_file.read_text(encoding="utf-8"))
         return True
 
     logger.debug("Content of %s is already up to date. Skipping.", short_path(output_file))
+    _remember_output(output_file, existing_hash, current_content)
     return False
 
 
@@ -602,12 +647,18 @@ def compile_single_file(
     return inlined_for_file, int(written)
 
 
+def _compile_single_file_args(args: tuple) -> tuple[int, int]:
+    """Unpack one argument tuple for compile_single_file; Pool.imap passes a single argument."""
+    return compile_single_file(*args)
+
+
 def run_compile_all(
     input_dir: Path,
     output_path: Path,
     dry_run: bool = False,
     parallelism: int | None = None,
     force: bool = False,
+    progress_callback: Callable[[int, int, Path], None] | None = None,
 ) -> int:
     """
     Main function to process a directory of uncompiled GitLab CI files.
@@ -619,6 +670,8 @@ def run_compile_all(
         dry_run (bool): If True, simulate the process without writing any files.
         parallelism (int | None): Maximum number of processes to use for parallel compilation.
         force (bool): If True, compile even if it appears to not be need because nothing changed.
+        progress_callback (Callable[[int, int, Path], None] | None): Called as ``(done, total, source)``
+            after each file is compiled. An exception raised from it stops the run.
 
     Returns:
         The total number of inlined sections across all files.
@@ -679,17 +732,23 @@ def run_compile_all(
             (src, out, input_dir, variables, input_dir, dry_run, inferred_cli_command, output_path)
             for src, out, variables in files_to_process
         ]
+        # imap hands results back as they finish, so progress is reported (and the callback can
+        # stop the run) while workers are still busy; leaving the with-block terminates the pool.
         with multiprocessing.Pool(processes=max_workers) as pool:
-            results = pool.starmap(compile_single_file, args_list)
-        total_inlined_count += sum(inlined for inlined, _ in results)
-        written_files_count += sum(written for _, written in results)
+            for done, (inlined_for_file, wrote) in enumerate(pool.imap(_compile_single_file_args, args_list), 1):
+                total_inlined_count += inlined_for_file
+                written_files_count += wrote
+                if progress_callback is not None:
+                    progress_callback(done, total_files, files_to_process[done - 1][0])
     else:
-        for src, out, variables in files_to_process:
+        for done, (src, out, variables) in enumerate(files_to_process, 1):
             inlined_for_file, wrote = compile_single_file(
                 src, out, input_dir, variables, input_dir, dry_run, inferred_cli_command, output_path
             )
             total_inlined_count += inlined_for_file
             written_files_count += wrote
+            if progress_callback is not None:
+                progress_callback(done, total_files, src)
 
     # After successful compilation, mark as complete
     if not dry_run and (total_inlined_count > 0 or written_files_count > 0):
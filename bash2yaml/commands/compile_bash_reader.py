@@ -81,6 +81,38 @@ def secure_join(
     return candidate
 
 
+def _read_script_lines(path: Path) -> list[str]:
+    """
+    Read a script as UTF-8 and split it into lines, keeping line endings.
+
+    Equivalent to ``path.open("r", encoding="utf-8").readlines()`` (including
+    universal newline translation) but reads the whole file with raw ``os.read``
+    calls instead of going through a buffered text wrapper.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            # One read covers the whole file; the loop only matters if it grew or is a pipe.
+            chunk = os.read(fd, max(size, 4096) + 1)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    text = b"".join(chunks).decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [line + "\n" for line in text.split("\n")]
+    # split() leaves a trailing "" for a final newline (or for an empty file)
+    last = lines.pop()
+    if last != "\n":
+        lines.append(last[:-1])
+    return lines
+
+
 def read_bash_script(path: Path) -> str:
     """
     Reads a bash script and inlines any sourced files.
@@ -170,117 +202,115 @@ def inline_bash_source(
     skip_next_line = False
 
     try:
-        with main_script_path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-            # --- (FIX) SHEBANG HANDLING MOVED HERE ---
-            # Only strip the shebang if this is the top-level script (_depth == 0).
-            # This respects pragmas because the logic now happens *before* line-by-line processing.
-            if _depth == 0 and lines and lines[0].startswith("#!"):
-                logger.debug(f"Stripping shebang from main script: {lines[0].strip()}")
-                lines = lines[1:]
-
-            for line_num, line in enumerate(lines, 1):
-                source_match = SOURCE_COMMAND_REGEX.match(line)
-                pragma_match = PRAGMA_REGEX.search(line)
-                pragma_command = pragma_match.group("command").lower() if pragma_match else None
-
-                # --- (FIX) Phase 1: State Management & Strippable Pragmas ---
-                # These pragmas are control directives and should be stripped from the output.
-                if pragma_command == "start-do-not-inline":
-                    if in_do_not_inline_block:
-                        raise PragmaError(f"Cannot nest 'start-do-not-inline' at {main_script_path}:{line_num}")
-                    in_do_not_inline_block = True
-                    continue  # Strip the pragma line itself
-
-                if pragma_command == "end-do-not-inline":
-                    if not in_do_not_inline_block:
-                        raise PragmaError(f"Found 'end-do-not-inline' without 'start' at {main_script_path}:{line_num}")
-                    in_do_not_inline_block = False
-                    continue  # Strip the pragma line itself
-
-                if pragma_command == "do-not-inline-next-line":
-                    skip_next_line = True
-                    continue  # Strip the pragma line itself
-
-                # Any line with a 'do-not-inline' pragma is now stripped.
-                if pragma_command == "do-not-inline":
-                    continue
-
-                # --- (FIX) Phase 2: Content Filtering ---
-                # If we are inside a do-not-inline block, strip this line of content.
+        lines = _read_script_lines(main_script_path)
+        # --- (FIX) SHEBANG HANDLING MOVED HERE ---
+        # Only strip the shebang if this is the top-level script (_depth == 0).
+        # This respects pragmas because the logic now happens *before* line-by-line processing.
+        if _depth == 0 and lines and lines[0].startswith("#!"):
+            logger.debug(f"Stripping shebang from main script: {lines[0].strip()}")
+            lines = lines[1:]
+
+        for line_num, line in enumerate(lines, 1):
+            source_match = SOURCE_COMMAND_REGEX.match(line)
+            pragma_match = PRAGMA_REGEX.search(line)
+            pragma_command = pragma_match.group("command").lower() if pragma_match else None
+
+            # --- (FIX) Phase 1: State Management & Strippable Pragmas ---
+            # These pragmas are control directives and should be stripped from the output.
+            if pragma_command == "start-do-not-inline":
                 if in_do_not_inline_block:
-                    continue
-
-                # --- Phase 3: Line-by-line Processing (for lines we intend to keep) ---
-                should_inline = source_match is not None
-                reason_to_skip = ""
-
-                if skip_next_line:
-                    reason_to_skip = "previous line had 'do-not-inline-next-line' pragma"
-                    should_inline = False
-                    skip_next_line = False  # Consume the flag
-                    continue
-                # elif in_do_not_inline_block:
-                #     reason_to_skip = "currently in 'do-not-inline' block"
-                #     should_inline = False
-                if pragma_command == "do-not-inline":
-                    reason_to_skip = "line contains 'do-not-inline' pragma"
-                    should_inline = False
-                    # Line is kept, just not inlined. Warning for non-sourcing lines.
-                    if not source_match:
-                        logger.warning(
-                            "Pragma 'do-not-inline' on non-sourcing line at %s:%d has no effect.",
-                            main_script_path,
-                            line_num,
-                        )
-
-                if pragma_command == "allow-outside-root" and not source_match:
+                    raise PragmaError(f"Cannot nest 'start-do-not-inline' at {main_script_path}:{line_num}")
+                in_do_not_inline_block = True
+                continue  # Strip the pragma line itself
+
+            if pragma_command == "end-do-not-inline":
+                if not in_do_not_inline_block:
+                    raise PragmaError(f"Found 'end-do-not-inline' without 'start' at {main_script_path}:{line_num}")
+                in_do_not_inline_block = False
+                continue  # Strip the pragma line itself
+
+            if pragma_command == "do-not-inline-next-line":
+                skip_next_line = True
+                continue  # Strip the pragma line itself
+
+            # Any line with a 'do-not-inline' pragma is now stripped.
+            if pragma_command == "do-not-inline":
+                continue
+
+            # --- (FIX) Phase 2: Content Filtering ---
+            # If we are inside a do-not-inline block, strip this line of content.
+            if in_do_not_inline_block:
+                continue
+
+            # --- Phase 3: Line-by-line Processing (for lines we intend to keep) ---
+            should_inline = source_match is not None
+            reason_to_skip = ""
+
+            if skip_next_line:
+                reason_to_skip = "previous line had 'do-not-inline-next-line' pragma"
+                should_inline = False
+                skip_next_line = False  # Consume the flag
+                continue
+            # elif in_do_not_inline_block:
+            #     reason_to_skip = "currently in 'do-not-inline' block"
+            #     should_inline = False
+            if pragma_command == "do-not-inline":
+                reason_to_skip = "line contains 'do-not-inline' pragma"
+                should_inline = False
+                # Line is kept, just not inlined. Warning for non-sourcing lines.
+                if not source_match:
                     logger.warning(
-                        "Pragma 'allow-outside-root' on non-sourcing line at %s:%d has no effect.",
+                        "Pragma 'do-not-inline' on non-sourcing line at %s:%d has no effect.",
                         main_script_path,
                         line_num,
                     )
 
-                # --- Perform Action: Inline or Append ---
-                if should_inline and source_match:
-                    sourced_script_name = source_match.group("path")
-                    bypass_security = pragma_command == "allow-outside-root"
-                    try:
-                        sourced_script_path = secure_join(
-                            base_dir=main_script_path.parent,
-                            user_path=sourced_script_name,
-                            allowed_root=allowed_root,
-                            bypass_security_check=bypass_security,
-                        )
-                    except (FileNotFoundError, SourceSecurityError) as e:
-                        logger.error(
-                            "Blocked/missing source '%s' from '%s': %s",
-                            short_path(Path(sourced_script_name)),
-                            short_path(main_script_path),
-                            e,
-                        )
-                        raise
-
-                    logger.info("Inlining sourced file: %s -> %s", sourced_script_name, short_path(sourced_script_path))
-                    inlined = inline_bash_source(
-                        sourced_script_path,
-                        processed_files,
+            if pragma_command == "allow-outside-root" and not source_match:
+                logger.warning(
+                    "Pragma 'allow-outside-root' on non-sourcing line at %s:%d has no effect.",
+                    main_script_path,
+                    line_num,
+                )
+
+            # --- Perform Action: Inline or Append ---
+            if should_inline and source_match:
+                sourced_script_name = source_match.group("path")
+                bypass_security = pragma_command == "allow-outside-root"
+                try:
+                    sourced_script_path = secure_join(
+                        base_dir=main_script_path.parent,
+                        user_path=sourced_script_name,
                         allowed_root=allowed_root,
-                        max_depth=max_depth,
-                        _depth=_depth + 1,
+                        bypass_security_check=bypass_security,
+                    )
+                except (FileNotFoundError, SourceSecurityError) as e:
+                    logger.error(
+                        "Blocked/missing source '%s' from '%s': %s",
+                        short_path(Path(sourced_script_name)),
+                        short_path(main_script_path),
+                        e,
+                    )
+                    raise
+
+                logger.info("Inlining sourced file: %s -> %s", sourced_script_name, short_path(sourced_script_path))
+                inlined = inline_bash_source(
+                    sourced_script_path,
+                    processed_files,
+                    allowed_root=allowed_root,
+                    max_depth=max_depth,
+                    _depth=_depth + 1,
+                )
+                final_content_lines.append(inlined)
+            else:
+                if source_match and reason_to_skip:
+                    logger.info(
+                        "Skipping inline of '%s' at %s:%d because %s.",
+                        source_match.group("path"),
+                        main_script_path,
+                        line_num,
+                        reason_to_skip,
                     )
-                    final_content_lines.append(inlined)
-                else:
-                    if source_match and reason_to_skip:
-                        logger.info(
-                            "Skipping inline of '%s' at %s:%d because %s.",
-                            source_match.group("path"),
-                            main_script_path,
-                            line_num,
-                            reason_to_skip,
-                        )
-                    final_content_lines.append(line)
+                final_content_lines.append(line)
 
         if in_do_not_inline_block:
             raise PragmaError(f"Unclosed 'start-do-not-inline' pragma in file: {short_path(main_script_path)}")
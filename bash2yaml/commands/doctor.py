@@ -3,9 +3,11 @@ from __future__ import annotations
 import contextlib
 import io
 import logging
+import os
 import re
 import shutil
 import subprocess  # nosec
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from bash2yaml.commands.detect_drift import run_detect_drift
@@ -57,6 +59,35 @@ def get_command_version(cmd: str) -> str:
         return f"{Colors.FAIL}Error checking version{Colors.ENDC}"
 
 
+_YAML_SUFFIXES = (".yml", ".yaml")
+_SCRIPT_SUFFIXES = (".sh", ".bash", ".py", ".rb", ".js", ".ps1")
+
+
+def _scan_sources(root: Path) -> tuple[list[str], list[str]]:
+    """Walk *root* once with ``os.scandir`` and return (yaml_files, script_files)."""
+    yaml_files: list[str] = []
+    script_files: list[str] = []
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(_YAML_SUFFIXES):
+                        yaml_files.append(entry.path)
+                    elif entry.name.endswith(_SCRIPT_SUFFIXES):
+                        script_files.append(entry.path)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory: {e}")
+    return yaml_files, script_files
+
+
+def _read_text(path: str) -> str:
+    with open(path, "rb") as handle:
+        return handle.read().decode("utf-8")
+
+
 def find_unreferenced_scripts(input_path: Path) -> list[Path]:
     """
     Finds script files in the input directory that do not appear to be referenced
@@ -65,17 +96,16 @@ def find_unreferenced_scripts(input_path: Path) -> list[Path]:
     if not input_path.is_dir():
         return []
 
-    all_yaml_content = ""
-    yaml_files = list(input_path.rglob("*.yml")) + list(input_path.rglob("*.yaml"))
-    for yaml_file in yaml_files:
-        all_yaml_content += yaml_file.read_text(encoding="utf-8")
+    yaml_files, script_files = _scan_sources(input_path)
+    # Reads are I/O bound, so overlap them.
+    with ThreadPoolExecutor(max_workers=min(32, len(yaml_files) or 1)) as executor:
+        all_yaml_content = "".join(executor.map(_read_text, yaml_files))
 
     unreferenced = []
-    script_patterns = ["*.sh", "*.bash", "*.py", "*.rb", "*.js", "*.ps1"]
-    for pattern in script_patterns:
-        for script_file in input_path.rglob(pattern):
-            if script_file.name not in all_yaml_content:
-                unreferenced.append(script_file)
+    for suffix in _SCRIPT_SUFFIXES:
+        for script_file in script_files:
+            if script_file.endswith(suffix) and os.path.basename(script_file) not in all_yaml_content:
+                unreferenced.append(Path(script_file))
 
     return unreferenced
 
@@ -251,6 +251,18 @@ class Config:
         """Enable file watching mode for compile command."""
         return self.get_bool("watch", section="compile")
 
+    @property
+    def compile_poll_interval(self) -> float | None:
+        """Seconds between scans when watching by polling; None means native file events."""
+        value = self.get_float("poll_interval", section="compile")
+        if value is None:
+            # Also honor a top-level key, e.g. BASH2YAML_POLL_INTERVAL
+            value = self.get_float("poll_interval")
+        if value is not None and value <= 0:
+            logger.warning("Config value for 'poll_interval' must be greater than 0. Ignoring.")
+            raise ConfigInvalid()
+        return value
+
     @property
     def max_artifact_size_mb(self) -> float | None:
         """Maximum artifact size in MB before compile fails."""
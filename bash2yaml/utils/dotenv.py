@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 import os
-import re
 from pathlib import Path
 from typing import TypedDict
 
@@ -18,6 +17,36 @@ class EnvVar(TypedDict):
     description: str | None
 
 
+def _split_assignment(line: str) -> tuple[str, str] | None:
+    """
+    Splits an already-stripped ``KEY=VALUE`` or ``export KEY=VALUE`` line.
+    Uses C-level string methods rather than a regex, since this runs once per line.
+
+    Args:
+        line: The stripped line.
+
+    Returns:
+        tuple[str, str] | None: The key and the unstripped value, or None if the line is not an assignment.
+    """
+    eq = line.find("=")
+    if eq <= 0:
+        return None
+    key = line[:eq]
+    if key.startswith("export") and key[6:7].isspace():
+        key = key[6:].lstrip()
+    # For ASCII text, isidentifier() is exactly [A-Za-z_][A-Za-z0-9_]*
+    if not (key.isascii() and key.isidentifier()):
+        return None
+    return key, line[eq + 1 :]
+
+
+def _unquote(value: str) -> str:
+    """Removes one pair of matching surrounding quotes from a stripped value."""
+    if value[:1] in ('"', "'") and value.endswith(value[0]):
+        return value[1:-1]
+    return value
+
+
 def parse_env_content_with_descriptions(content: str) -> dict[str, EnvVar]:
     """
     Parses .env-style content string into a dictionary with descriptions.
@@ -53,14 +82,11 @@ def parse_env_content_with_descriptions(content: str) -> dict[str, EnvVar]:
             continue
 
         # Try to match variable assignment
-        match = re.match(r"^(?:export\s+)?(?P<key>[A-Za-z_][A-Za-z0-9_]*)=(?P<value>.*)$", stripped_line)
-        if match:
-            key = match.group("key")
-            value = match.group("value").strip()
-
+        assignment = _split_assignment(stripped_line)
+        if assignment:
+            key, value = assignment
             # Remove matching quotes from the value
-            if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-                value = value[1:-1]
+            value = _unquote(value.strip())
 
             variables[key] = EnvVar(value=value, description=current_description)
             logger.debug(
@@ -171,7 +197,8 @@ def env_vars_to_simple_dict(env_vars: dict[str, EnvVar]) -> dict[str, str]:
 def parse_env_file(file_content: str) -> dict[str, str]:
     """
     Legacy function: Parses a .env-style file content into a simple dictionary.
-    This maintains compatibility with existing code by delegating to the new implementation.
+    Same rules as parse_env_content_with_descriptions, minus the comment tracking and
+    per-variable logging, since this is the hot path for compile.
 
     Args:
         file_content: The content of the variables file.
@@ -179,5 +206,13 @@ def parse_env_file(file_content: str) -> dict[str, str]:
     Returns:
         dict[str, str]: A dictionary of the parsed variables.
     """
-    env_vars = parse_env_content_with_descriptions(file_content)
-    return env_vars_to_simple_dict(env_vars)
+    variables: dict[str, str] = {}
+    for line in file_content.splitlines():
+        stripped_line = line.strip()
+        if not stripped_line or stripped_line[0] == "#":
+            continue
+        assignment = _split_assignment(stripped_line)
+        if assignment:
+            key, value = assignment
+            variables[key] = _unquote(value.strip())
+    return variables
@@ -12,6 +12,11 @@ _EXECUTORS = {"bash", "sh", "pwsh"}
 _DOT_SOURCE = {"source", "."}
 _VALID_SUFFIXES = {".sh", ".ps1", ".bash"}
 _ENV_ASSIGN_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+# Characters that make shlex do more than split on whitespace.
+_SHLEX_SPECIAL_RE = re.compile(r"[\"'#]")
+_DROP_QUOTES = str.maketrans("", "", "\"'")
+# shlex's default whitespace set.
+_SHLEX_WHITESPACE_RE = re.compile(r"[ \t\r\n]+")
 
 
 def split_cmd(cmd_line: str) -> list[str] | None:
@@ -25,6 +30,9 @@ def split_cmd(cmd_line: str) -> list[str] | None:
         >>> split_cmd('./script.sh arg1 "arg 2"')
         ['./script.sh', 'arg1', 'arg 2']
     """
+    if not _SHLEX_SPECIAL_RE.search(cmd_line):
+        # No quotes or comments: shlex would only split on whitespace.
+        return [tok for tok in _SHLEX_WHITESPACE_RE.split(cmd_line) if tok]
     try:
         lex = shlex.shlex(cmd_line, posix=True)
         lex.whitespace_split = True  # split on whitespace
@@ -48,6 +56,12 @@ def extract_script_path(cmd_line: str) -> str | None:
     if not isinstance(cmd_line, str):
         raise Bash2YamlError("Expected string for cmd_line")
 
+    # Most CI lines mention no script at all; skip tokenizing them. Quotes are
+    # dropped first since shlex can join a suffix across them ('"x."sh').
+    lowered = cmd_line.translate(_DROP_QUOTES).lower()
+    if not any(suffix in lowered for suffix in _VALID_SUFFIXES):
+        return None
+
     tokens = split_cmd(cmd_line)
     if not tokens:
         return None
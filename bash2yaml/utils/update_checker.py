@@ -25,14 +25,17 @@ Return contract:
 from __future__ import annotations
 
 import atexit
+import functools
 import logging
 import os
+import queue
 import sys
 import tempfile
 import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Final
 from urllib import error
 
 import orjson as json
@@ -53,7 +56,12 @@ from bash2yaml.utils.urllib3_helper import fetch_json
 # Global state for background checking
 _background_check_result: str | None = None
 _background_check_registered = False
+# Long-lived daemon worker and its job queue, reused across checks.
 _background_check_thread: threading.Thread | None = None
+_background_jobs: queue.SimpleQueue | None = None
+
+# Parsed cache files keyed by path, valid while (st_mtime_ns, st_size) match.
+_parsed_cache: dict[str, tuple[int, int, dict]] = {}
 
 
 class PackageNotFoundError(Exception):
@@ -64,13 +72,14 @@ class NetworkError(Exception):
     """Raised when a network error occurs while contacting PyPI."""
 
 
-@dataclass(frozen=True)
 class _Color:
-    YELLOW: str = "\033[93m"
-    GREEN: str = "\033[92m"
-    RED: str = "\033[91m"
-    BLUE: str = "\033[94m"
-    ENDC: str = "\033[0m"
+    """ANSI color codes; used as a namespace, never instantiated per message."""
+
+    YELLOW: Final = "\033[93m"
+    GREEN: Final = "\033[92m"
+    RED: Final = "\033[91m"
+    BLUE: Final = "\033[94m"
+    ENDC: Final = "\033[0m"
 
 
 @dataclass(frozen=True)
@@ -81,6 +90,22 @@ class VersionInfo:
     latest_dev: str | None
     current_yanked: bool
 
+    @classmethod
+    def from_cache(cls, record: dict) -> VersionInfo:
+        """Build from a cache record written by ``save_cache``.
+
+        Args:
+            record: Parsed cache JSON.
+
+        Returns:
+            Version information; missing fields fall back to "nothing known".
+        """
+        return cls(
+            latest_stable=record.get("latest_stable"),
+            latest_dev=record.get("latest_dev"),
+            current_yanked=bool(record.get("current_yanked", False)),
+        )
+
 
 def get_logger(user_logger: logging.Logger | None) -> logging.Logger:
     """Get a logger instance.
@@ -93,8 +118,12 @@ def get_logger(user_logger: logging.Logger | None) -> logging.Logger:
     """
     if isinstance(user_logger, logging.Logger):
         return user_logger
+    return _default_logger()
+
 
-    # Create a default logger
+@functools.lru_cache(maxsize=1)
+def _default_logger() -> logging.Logger:
+    """Create and configure the module's fallback logger once per process."""
     logger = logging.getLogger("update_checker")
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stderr)
@@ -147,12 +176,20 @@ def load_cache(cache_file: Path, logger: logging.Logger) -> dict | None:
     """
     logger.debug(f"Attempting to load cache from {cache_file}")
 
-    if not cache_file.exists():
+    try:
+        st = os.stat(cache_file)
+    except FileNotFoundError:
         logger.debug(f"Cache file {cache_file} does not exist")
         return None
 
+    key = str(cache_file)
+    hit = _parsed_cache.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        logger.debug("Cache file unchanged since last parse, reusing it")
+        return dict(hit[2])
+
     try:
-        raw = cache_file.read_text(encoding="utf-8")
+        raw = cache_file.read_bytes()
         logger.debug(f"Read {len(raw)} bytes from cache file")
 
         data = json.loads(raw)
@@ -160,8 +197,9 @@ def load_cache(cache_file: Path, logger: logging.Logger) -> dict | None:
             logger.debug(f"Cache data is not a dict, got {type(data)}")
             return None
 
+        _parsed_cache[key] = (st.st_mtime_ns, st.st_size, data)
         logger.debug(f"Successfully loaded cache with keys: {list(data.keys())}")
-        return data
+        return dict(data)
 
     except json.JSONDecodeError as e:
         logger.debug(f"Failed to parse JSON from cache: {e}")
@@ -226,10 +264,14 @@ def save_cache(cache_dir: Path, cache_file: Path, payload: dict, logger: logging
     logger.debug(f"Created cache directory: {cache_dir}")
 
     body = {"last_check": time.time(), **payload}
-    cache_content = json.dumps(body).decode()
+    cache_content = json.dumps(body)
 
-    cache_file.write_text(cache_content, encoding="utf-8")
+    cache_file.write_bytes(cache_content)
     logger.debug(f"Wrote {len(cache_content)} bytes to cache file")
+    # Record what we just wrote: a same-size rewrite within mtime granularity would otherwise
+    # still match the previous parse.
+    st = os.stat(cache_file)
+    _parsed_cache[str(cache_file)] = (st.st_mtime_ns, st.st_size, body)
 
 
 def reset_cache(package_name: str) -> None:
@@ -239,6 +281,7 @@ def reset_cache(package_name: str) -> None:
         package_name: Package name to clear from cache.
     """
     _, cache_file = cache_paths(package_name)
+    _parsed_cache.pop(str(cache_file), None)
     if cache_file.exists():
         cache_file.unlink(missing_ok=True)
 
@@ -269,6 +312,25 @@ def fetch_pypi_json(url: str, timeout: float, logger: logging.Logger) -> dict:
         raise PackageNotFoundError() from e
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_version(version_str: str) -> _version.Version:
+    """Parse a version string, memoized.
+
+    PyPI release lists and cached update info repeat the same strings, and
+    ``packaging`` parses each one with a regex.
+
+    Args:
+        version_str: Version string to parse.
+
+    Returns:
+        Parsed version.
+
+    Raises:
+        _version.InvalidVersion: If version string is invalid.
+    """
+    return _version.parse(version_str)
+
+
 def is_dev_version(version_str: str) -> bool:
     """Check if a version string represents a development version.
 
@@ -281,7 +343,7 @@ def is_dev_version(version_str: str) -> bool:
     Raises:
         _version.InvalidVersion: If version string is invalid.
     """
-    v = _version.parse(version_str)
+    v = _parse_version(version_str)
     return v.is_devrelease
 
 
@@ -363,7 +425,7 @@ def get_version_info_from_pypi(
 
             for v_str in releases.keys():
                 try:
-                    v = _version.parse(v_str)
+                    v = _parse_version(v_str)
                 except _version.InvalidVersion:
                     logger.debug(f"Skipping invalid version: {v_str}")
                     continue
@@ -431,13 +493,13 @@ def format_update_message(
     messages: list[str] = []
 
     try:
-        current = _version.parse(current_version_str)
+        current = _parse_version(current_version_str)
         logger.debug(f"Parsed current version: {current}")
     except _version.InvalidVersion as e:
         logger.debug(f"Invalid current version '{current_version_str}': {e}")
         current = None
 
-    c = _Color() if can_use_color() else None
+    c = _Color if can_use_color() else None
     logger.debug(f"Using colors: {c is not None}")
 
     # Check if current version is yanked
@@ -454,7 +516,7 @@ def format_update_message(
     # Check for stable updates
     if version_info.latest_stable and current:
         try:
-            latest_stable = _version.parse(version_info.latest_stable)
+            latest_stable = _parse_version(version_info.latest_stable)
             if latest_stable > current:
                 logger.debug(f"Found stable update: {latest_stable} > {current}")
                 if c:
@@ -470,7 +532,7 @@ def format_update_message(
     # Check for dev versions
     if version_info.latest_dev:
         try:
-            latest_dev = _version.parse(version_info.latest_dev)
+            latest_dev = _parse_version(version_info.latest_dev)
             if current is None or latest_dev > current:
                 logger.debug(f"Found dev version: {latest_dev}")
                 if c:
@@ -523,10 +585,47 @@ def _background_update_worker(
         _background_check_result = None
 
 
+def _background_job_loop(jobs: queue.SimpleQueue) -> None:
+    """Run queued background jobs forever on the daemon worker thread."""
+    while True:
+        target, args = jobs.get()
+        try:
+            target(*args)
+        except Exception:  # nosec  # pylint: disable=broad-except
+            # Jobs handle their own errors; never let one kill the worker.
+            pass
+
+
+def _submit_background_job(target, args: tuple) -> None:
+    """Queue *target* on the shared daemon worker, starting it on first use.
+
+    A plain daemon thread is used rather than ``ThreadPoolExecutor`` because
+    executor workers are joined at interpreter exit, which would make the CLI
+    wait on a slow PyPI request.
+    """
+    global _background_check_thread, _background_jobs
+
+    if _background_jobs is None or _background_check_thread is None or not _background_check_thread.is_alive():
+        _background_jobs = queue.SimpleQueue()
+        _background_check_thread = threading.Thread(
+            target=_background_job_loop,
+            args=(_background_jobs,),
+            daemon=True,
+            name="UpdateChecker",
+        )
+        _background_check_thread.start()
+    _background_jobs.put((target, args))
+
+
 def _exit_handler() -> None:
     """Exit handler to display update message if available."""
-    if _background_check_result:
-        print(f"\n{_background_check_result}", file=sys.stderr)
+    message = _background_check_result
+    if message:
+        # The message is already colorized by format_update_message; write it as-is.
+        stream = sys.stderr
+        stream.write("\n")
+        stream.write(message)
+        stream.write("\n")
 
 
 def start_background_update_check(
@@ -539,8 +638,8 @@ def start_background_update_check(
 ) -> None:
     """Start a background update check that displays results on program exit.
 
-    This function returns immediately (zero cost to user) and starts a background
-    thread to check for updates. If an update is available, it will be shown when
+    This function returns immediately (zero cost to user) and hands the check to
+    a reused background daemon thread. If an update is available, it will be shown when
     the program exits.
 
     Args:
@@ -550,7 +649,7 @@ def start_background_update_check(
         cache_ttl_seconds: Cache time-to-live in seconds.
         include_prereleases: Whether to consider prereleases newer.
     """
-    global _background_check_registered, _background_check_result, _background_check_thread
+    global _background_check_registered, _background_check_result
 
     # Only catch exceptions at this entry point
     try:
@@ -567,24 +666,17 @@ def start_background_update_check(
         if fresh and isinstance(cached, dict):
             actual_logger.debug("Using fresh cache for background check")
             # Recompute message against *current* environment (current_version)
-            vi = VersionInfo(
-                latest_stable=cached.get("latest_stable"),
-                latest_dev=cached.get("latest_dev"),
-                current_yanked=bool(cached.get("current_yanked", False)),
-            )
+            vi = VersionInfo.from_cache(cached)
             msg = format_update_message(package_name, current_version, vi, actual_logger)
             _background_check_result = msg if msg else None
             return
 
-        actual_logger.debug("Starting background thread for update check")
+        actual_logger.debug("Queueing background update check")
         # Cache stale/missing -> refresh in the background; result will be printed on exit (if ready)
-        _background_check_thread = threading.Thread(
-            target=_background_update_worker,
-            args=(package_name, current_version, logger, cache_ttl_seconds, include_prereleases),
-            daemon=True,
-            name=f"UpdateChecker-{package_name}",
+        _submit_background_job(
+            _background_update_worker,
+            (package_name, current_version, logger, cache_ttl_seconds, include_prereleases),
         )
-        _background_check_thread.start()
 
     except Exception as e:
         # Silently fail for background checks only - log if we have a logger
@@ -626,11 +718,7 @@ def check_for_updates(
     if fresh and isinstance(cached, dict):
         actual_logger.debug("Using fresh cache for synchronous check")
         # Recompute message using current state/version — no API call
-        vi = VersionInfo(
-            latest_stable=cached.get("latest_stable"),
-            latest_dev=cached.get("latest_dev"),
-            current_yanked=bool(cached.get("current_yanked", False)),
-        )
+        vi = VersionInfo.from_cache(cached)
         msg = format_update_message(package_name, current_version, vi, actual_logger)
         return msg if msg else None
 
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+import re
+
+# Line boundaries recognized by str.splitlines() other than "\n".
+_OTHER_LINE_BREAKS = re.compile("[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
 
 
 def remove_leading_blank_lines(text: str) -> str:
@@ -17,26 +21,41 @@ def remove_leading_blank_lines(text: str) -> str:
         >>> remove_leading_blank_lines("\\n\\n\\n")
         ''
     """
-    lines = text.splitlines()
-    # Find the first non-blank line
-    for i, line in enumerate(lines):
-        if line.strip() != "":
-            return "\n".join(lines[i:])
-    return ""  # All lines were blank
-
-
-def short_path(path: Path) -> str:
+    stripped = text.lstrip()
+    if not stripped:
+        return ""  # All lines were blank
+    if _OTHER_LINE_BREAKS.search(text):
+        # Rare: CRLF or exotic separators, normalize to "\n" the slow way.
+        lines = text.splitlines()
+        for i, line in enumerate(lines):
+            if line.strip() != "":
+                return "\n".join(lines[i:])
+    # Only "\n" separators: slice from the start of the first non-blank line.
+    start = text.rfind("\n", 0, len(text) - len(stripped)) + 1
+    return text[start:-1] if text.endswith("\n") else text[start:]
+
+
+def short_path(path: str | os.PathLike[str]) -> str:
     """
     Return the path relative to the current working directory if possible.
     Otherwise, return the absolute path.
 
+    Works on plain strings (``os.getcwd``/``os.path.realpath``) because this is
+    called for nearly every log line and ``Path.cwd()``/``relative_to`` build
+    extra ``Path`` objects each time.
+
     Args:
-        path (Path): The path to format for debugging.
+        path (str | os.PathLike[str]): The path to format for debugging.
 
     Returns:
         str: Relative path or absolute path as a fallback.
     """
-    try:
-        return str(path.relative_to(Path.cwd()))
-    except ValueError:
-        return str(path.resolve())
+    path_str = os.fspath(path)
+    cwd = os.getcwd()
+    prefix = cwd if cwd.endswith(os.sep) else cwd + os.sep
+    norm_path = os.path.normcase(path_str)
+    if norm_path.startswith(os.path.normcase(prefix)):
+        return path_str[len(prefix) :]
+    if norm_path == os.path.normcase(cwd):
+        return "."
+    return os.path.realpath(path_str)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 
 from ruamel.yaml.error import YAMLError
 
@@ -10,6 +9,9 @@ from bash2yaml.utils.yaml_factory import get_yaml
 def normalize_for_compare(text: str) -> str:
     """Normalize whitespace and line endings for text comparison.
 
+    Line endings become ``\\n``, trailing whitespace is dropped from every line,
+    and leading/trailing blank lines are removed.
+
     Examples:
         >>> normalize_for_compare("hello\\r\\nworld\\n")
         'hello\\nworld'
@@ -18,20 +20,17 @@ def normalize_for_compare(text: str) -> str:
         >>> normalize_for_compare("line1\\nline2\\n")
         'line1\\nline2'
     """
-    # Normalize line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    # Trim trailing whitespace per line
-    text = "\n".join(line.rstrip() for line in text.splitlines())
-    # Ensure exactly one newline at EOF
-    if not text.endswith("\n"):
-        text += "\n"
-    # Collapse multiple blank lines at EOF to one (optional)
-    text = re.sub(r"\n{3,}$", "\n\n", text)
-    return text.strip(" \n")
+    # splitlines() already treats \r\n and bare \r as line breaks, and the final
+    # strip() drops any run of blank lines at EOF, so one split/rstrip/join pass is enough.
+    return "\n".join(map(str.rstrip, text.splitlines())).strip(" \n")
 
 
 def yaml_is_same(current_content: str, new_content: str) -> bool:
     """Compare YAML content, checking text, normalized text, and parsed equivalence."""
+    if current_content is new_content or current_content == new_content:
+        # Unchanged file; skip the strip() copies below.
+        return True
+
     if current_content.strip("\n") == new_content.strip("\n"):
         # Simple match.
         return True
@@ -18,21 +18,60 @@ Usage (internal):
 from __future__ import annotations
 
 import logging
+import os
+import queue
+import re
+import threading
 import time
 from pathlib import Path
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+from watchdog.observers.polling import PollingObserver
 
 from bash2yaml.commands.compile_all import run_compile_all
 from bash2yaml.plugins import get_pm
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_EXTENSIONS = frozenset({".yml", ".yaml", ".sh", ".bash"})
+# Editor swap/backup files; matched against the end of the raw event path.
+_TEMP_RE = re.compile(r"\.(?:swp|tmp)$|~$")
+# An untimed join can't be interrupted by Ctrl-C on Windows, so wake up there once a second.
+_JOIN_TIMEOUT = 1.0 if os.name == "nt" else None
+
+
+def _watched_extensions() -> tuple[frozenset[str], tuple[str, ...]]:
+    """
+    Built-in source extensions plus any contributed by plugins.
+
+    Returns:
+        Plain ``.ext`` suffixes (matched by set lookup) and any other patterns
+        (multi-dot or dotless, matched with ``endswith``).
+    """
+    exts = set(_DEFAULT_EXTENSIONS)
+    for extra in get_pm().hook.watch_file_extensions():
+        if extra:
+            exts.update(extra)
+    simple = frozenset(ext for ext in exts if ext.rfind(".") == 0)
+    return simple, tuple(sorted(exts - simple))
+
 
 class _RecompileHandler(FileSystemEventHandler):
     """
-    Fire the compiler every time a *.yml, *.yaml or *.sh file changes.
+    Fire the compiler when *.yml, *.yaml or *.sh files change.
+
+    Only files known to the handler count: the tree is scanned once up front
+    and the set is kept current from create/delete/move events, so churn in
+    unrelated files (``.git`` objects, editor dotfiles) never triggers a build.
+
+    Event callbacks only record the path and poke a one-slot wake-up queue, so
+    watchdog's dispatch thread never waits on a compile. A single worker thread
+    does the compiling: the first change after a quiet spell compiles right away
+    (leading edge); changes arriving within ``_min_gap`` of the last compile are
+    collected and compiled together at most ``_max_batch`` seconds after it, so
+    a burst of saves can't postpone the rebuild indefinitely.
     """
 
     def __init__(
@@ -49,35 +88,157 @@ class _RecompileHandler(FileSystemEventHandler):
             "output_path": output_path,
         }
         self._flags = {"dry_run": dry_run, "parallelism": parallelism}
-        self._debounce: float = 0.5  # seconds
-        self._last_run = 0.0
+        self._max_batch: float = 0.5  # longest a batched change waits, measured from the last compile
+        self._min_gap: float = 0.05  # changes closer than this to the last compile are batched
+        # Built once; the event callbacks run for every filesystem event.
+        self._accept, self._accept_other = _watched_extensions()
+        # Source files known to exist under input_dir; see track_tree().
+        self._tracked: set[str] = set()
+        # Changed paths since the last compile, drained by the worker thread.
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._last_fire: float = float("-inf")
+        # At most one queued wake-up: further pokes while one is waiting are redundant.
+        self._wakeup: queue.Queue[None] = queue.Queue(maxsize=1)
+        self._stopping = threading.Event()
+        self._worker: threading.Thread | None = None
+
+    # String-only hot path; avoid pathlib allocations. Event paths stay raw ``str`` from the
+    # callbacks through ``_pending``; only ``run_compile_all`` sees ``Path`` objects, built once in __init__.
+    def _is_source(self, path: str) -> bool:
+        """True for paths with a watched extension that aren't editor temp files."""
+        if _TEMP_RE.search(path):
+            return False
+        dot = path.rfind(".")
+        if dot >= 0 and path[dot:] in self._accept:
+            return True
+        return bool(self._accept_other) and path.endswith(self._accept_other)
 
-    def on_any_event(self, event: FileSystemEvent) -> None:
-        """Trigger recompile on relevant file changes with debouncing."""
-        # Skip directories, temp files, and non-relevant extensions
+    def track_tree(self, root: str) -> None:
+        """Record every source file under ``root`` so later events can be matched by path."""
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif self._is_source(entry.path):
+                            self._tracked.add(entry.path)
+            except OSError:
+                continue
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Start tracking a new source file and compile."""
         if event.is_directory:
             return
-        if event.src_path.endswith((".tmp", ".swp", "~")):  # type: ignore[arg-type]
+        src_path = os.fsdecode(event.src_path)
+        if self._is_source(src_path):
+            self._tracked.add(src_path)
+            self._trigger(src_path)
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        """Compile when a tracked file changes; everything else is noise."""
+        if event.is_directory:
             return
-        exts = {".yml", ".yaml", ".sh", ".bash"}
-        for extra in get_pm().hook.watch_file_extensions():
-            if extra:
-                exts.update(extra)
-        if not event.src_path.endswith(tuple(exts)):  # type: ignore[arg-type]
+        src_path = os.fsdecode(event.src_path)
+        if src_path in self._tracked:
+            self._trigger(src_path)
+
+    def _forget_tree(self, root: str) -> bool:
+        """Stop tracking everything under a removed directory; True if anything was tracked."""
+        prefix = root.rstrip(os.sep) + os.sep
+        gone = {p for p in self._tracked if p.startswith(prefix)}
+        self._tracked -= gone
+        return bool(gone)
+
+    def on_deleted(self, event: FileSystemEvent) -> None:
+        """Stop tracking a removed source file and compile without it."""
+        src_path = os.fsdecode(event.src_path)
+        if event.is_directory:
+            if self._forget_tree(src_path):
+                self._trigger(src_path)
+        elif src_path in self._tracked:
+            self._tracked.discard(src_path)
+            self._trigger(src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Follow renames, including editors that save by renaming a temp file over the original."""
+        src_path = os.fsdecode(event.src_path)
+        dest_path = os.fsdecode(event.dest_path)
+        if event.is_directory:
+            changed = self._forget_tree(src_path)
+            count = len(self._tracked)
+            self.track_tree(dest_path)
+            if changed or len(self._tracked) != count:
+                self._trigger(dest_path)
             return
+        changed = src_path in self._tracked
+        self._tracked.discard(src_path)
+        if self._is_source(dest_path):
+            self._tracked.add(dest_path)
+            changed = True
+        if changed:
+            self._trigger(dest_path)
+
+    def _trigger(self, path: str) -> None:
+        """Queue the change and wake the worker; returns without compiling."""
+        with self._lock:
+            self._pending.add(path)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="bash2yaml-recompile", daemon=True)
+                self._worker.start()
+        try:
+            self._wakeup.put_nowait(None)
+        except queue.Full:
+            pass  # a wake-up is already waiting; it will pick this change up
+
+    def _run(self) -> None:
+        """Worker loop: one compile per wake-up, until cancel()."""
+        while True:
+            self._wakeup.get()
+            if self._stopping.is_set():
+                return
+            self._process_wakeup()
 
-        now = time.monotonic()
-        if now - self._last_run < self._debounce:
+    def _process_wakeup(self) -> None:
+        """Hold back changes that follow a compile too closely, then compile the batch."""
+        elapsed = time.monotonic() - self._last_fire
+        if elapsed < self._min_gap and self._stopping.wait(self._max_batch - elapsed):
             return
-        self._last_run = now
+        # Changes that arrived while we waited are already in the batch.
+        try:
+            self._wakeup.get_nowait()
+        except queue.Empty:
+            pass
+        self._flush()
+
+    def _flush(self) -> None:
+        """Compile once for every change collected since the last flush."""
+        with self._lock:
+            batch = self._pending
+            self._pending = set()
+            if not batch:
+                return
+            self._last_fire = time.monotonic()
 
-        logger.info("🔄 Source changed; recompiling…")
+        logger.info("🔄 %d source file(s) changed; recompiling…", len(batch))
         try:
             run_compile_all(**self._paths, **self._flags)  # type: ignore[arg-type]
             logger.info("✅ Recompiled successfully.")
         except Exception as exc:  # pylint: disable=broad-except
             logger.error("❌ Recompilation failed: %s", exc, exc_info=True)
 
+    def cancel(self) -> None:
+        """Drop any pending compile and let the worker exit."""
+        with self._lock:
+            self._pending.clear()
+        self._stopping.set()
+        try:
+            self._wakeup.put_nowait(None)
+        except queue.Full:
+            pass
+
 
 def start_watch(
     *,
@@ -85,11 +246,21 @@ def start_watch(
     output_path: Path,
     dry_run: bool = False,
     parallelism: int | None = None,
+    poll_interval: float | None = None,
 ) -> None:
     """
     Start an in-process watchdog that recompiles whenever source files change.
 
     Blocks forever (Ctrl-C to stop).
+
+    Args:
+        input_dir: Directory of uncompiled sources to watch.
+        output_path: Where compiled output is written.
+        dry_run: Passed through to ``run_compile_all``.
+        parallelism: Passed through to ``run_compile_all``.
+        poll_interval: Seconds between scans when polling instead of using native
+            filesystem notifications. Useful in containers/CI where inotify watches
+            are scarce. None uses native events.
     """
     handler = _RecompileHandler(
         input_dir=input_dir,
@@ -98,16 +269,27 @@ def start_watch(
         parallelism=parallelism,
     )
 
-    observer = Observer()
+    handler.track_tree(str(input_dir))
+
+    observer: BaseObserver
+    if poll_interval:
+        logger.debug("Polling %s every %ss", input_dir, poll_interval)
+        observer = PollingObserver(timeout=poll_interval)
+    else:
+        observer = Observer()
+    # Always the whole input dir: compile_all reads new top-level files (.gitlab-ci.yml,
+    # *_variables.sh) from here, and the handler's tracked set already filters churn.
     observer.schedule(handler, str(input_dir), recursive=True)
 
     try:
         observer.start()
         logger.info("👀 Watching for changes to *.yml, *.yaml, *.sh … (Ctrl-C to quit)")
-        while True:
-            time.sleep(1)
+        # Block on the observer thread itself rather than waking up to poll.
+        while observer.is_alive():
+            observer.join(_JOIN_TIMEOUT)
     except KeyboardInterrupt:
         logger.info("⏹  Stopping watcher.")
     finally:
+        handler.cancel()
         observer.stop()
         observer.join()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+# tmpfs mount available on most Linux hosts and CI runners.
+_SHM_ROOT = "/dev/shm"  # nosec
+
+
+def _use_shm_tempdir() -> bool:
+    """Point ``tempfile`` at a tmpfs-backed directory when one is usable.
+
+    Returns:
+        True if ``tempfile.tempdir`` was redirected.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    if not os.path.isdir(_SHM_ROOT) or not os.access(_SHM_ROOT, os.W_OK):
+        return False
+    # Per user: /dev/shm is shared, and another user's dir of the same name would be unusable.
+    shm_tempdir = os.path.join(_SHM_ROOT, f"b2g_tests-{os.getuid()}")
+    try:
+        os.makedirs(shm_tempdir, mode=0o700, exist_ok=True)
+        owned = os.stat(shm_tempdir).st_uid == os.getuid()
+    except OSError:
+        return False
+    if not owned or not os.access(shm_tempdir, os.W_OK):
+        return False
+    tempfile.tempdir = shm_tempdir
+    return True
+
+
+def pytest_configure(config):
+    """Route ``tmp_path`` (and other ``tempfile`` users) to RAM on Linux.
+
+    Skipped when the caller pinned a location with ``--basetemp``.
+    """
+    if config.option.basetemp:
+        return
+    _use_shm_tempdir()
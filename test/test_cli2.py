@@ -158,6 +158,29 @@ def test_compile_watch_calls_start_watch(monkeypatch, run_cli, tmp_path):
     assert watch_args["output_path"] == out_dir
 
 
+def test_compile_watch_passes_poll_interval(monkeypatch, run_cli, tmp_path):
+    called: dict[str, Any] = {}
+    _patch_compile_deps(monkeypatch, called=called)
+
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+
+    code = run_cli(
+        ["bash2yaml", "compile", "--in", str(in_dir), "--out", str(out_dir), "--watch", "--poll-interval", "2.5"]
+    )
+
+    assert code == 0
+    assert called["start_watch"]["poll_interval"] == 2.5
+
+
+def test_compile_rejects_non_positive_poll_interval(run_cli, tmp_path):
+    code = run_cli(["bash2yaml", "compile", "--in", str(tmp_path), "--out", str(tmp_path), "--poll-interval", "0"])
+    # argparse usage error
+    assert code == 2
+
+
 def test_detect_drift_variants(monkeypatch, run_cli, tmp_path):
     called: dict[str, Any] = {}
     _patch_detect_drift_deps(monkeypatch, called=called)
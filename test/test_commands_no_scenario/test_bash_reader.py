@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from bash2yaml.commands.compile_bash_reader import inline_bash_source
+from bash2yaml.commands.compile_bash_reader import _read_script_lines, inline_bash_source
 
 
 def test_inline_bash_source_success_and_circular_dependency(tmp_path: Path):
@@ -81,3 +81,17 @@ def test_inline_bash_source_file_not_found(tmp_path: Path):
         assert "non_existent_file.sh" in str(excinfo.value)
     finally:
         del os.environ["BASH2YAML_SKIP_ROOT_CHECKS"]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b"", b"echo a\n", b"echo a\necho b", b"echo a\r\necho b\r\n", b"echo a\recho b\n\n", b"echo \xc3\xa9\x0c\n"],
+)
+def test_read_script_lines_matches_text_mode_readlines(tmp_path: Path, raw: bytes):
+    script = tmp_path / "script.sh"
+    script.write_bytes(raw)
+
+    with script.open("r", encoding="utf-8") as f:
+        expected = f.readlines()
+
+    assert _read_script_lines(script) == expected
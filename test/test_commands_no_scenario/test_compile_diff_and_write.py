@@ -165,3 +165,28 @@ def test_skip_when_no_changes_structurally(tmp_path: Path):
     # Nothing changed on disk
     assert out.read_text(encoding="utf-8") == content
     assert hash_file.read_text(encoding="utf-8").strip() == base64.b64encode(content.encode("utf-8")).decode("ascii")
+
+
+def test_second_write_skips_manual_edit_check_for_untouched_output(tmp_path: Path, monkeypatch):
+    out = tmp_path / "compiled.yml"
+    assert write_compiled_file(out, "a: 1\n", tmp_path, dry_run=False) is True
+
+    # Output and hash untouched since we wrote them: no YAML parsing needed to trust them
+    def no_yaml():
+        raise AssertionError("manual-edit check should have been skipped")
+
+    monkeypatch.setattr(m, "get_yaml", no_yaml)
+    assert write_compiled_file(out, "a: 1\n", tmp_path, dry_run=False) is False
+    assert write_compiled_file(out, "a: 2\n", tmp_path, dry_run=False) is True
+    assert out.read_text(encoding="utf-8") == "a: 2\n"
+
+
+def test_manual_edit_after_write_is_still_detected(tmp_path: Path):
+    out = tmp_path / "compiled.yml"
+    assert write_compiled_file(out, "a: 1\n", tmp_path, dry_run=False) is True
+
+    # Same size, so only the content digest tells them apart
+    out.write_text("a: 9\n", encoding="utf-8")
+
+    with pytest.raises(m.CompileError):
+        write_compiled_file(out, "a: 2\n", tmp_path, dry_run=False)
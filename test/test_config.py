@@ -7,6 +7,7 @@ from unittest.mock import patch
 import pytest
 
 from bash2yaml import config as config_module
+from bash2yaml.errors.exceptions import ConfigInvalid
 
 
 @pytest.fixture(autouse=True)
@@ -149,3 +150,30 @@ def test_config_file_finding_logic(tmp_path: Path):
     config = config_module.config
 
     assert config.input_dir == "found_in_root"
+
+
+def test_compile_poll_interval_from_file_and_env(tmp_path: Path):
+    """poll_interval reads [compile] in the toml file; the env var wins over it."""
+    config_file = tmp_path / "bash2yaml.toml"
+    config_file.write_text("""
+        [compile]
+        poll_interval = 2.5
+        """)
+
+    config_module.reset_for_testing(config_path_override=config_file)
+    assert config_module.config.compile_poll_interval == 2.5
+
+    os.environ["BASH2YAML_COMPILE_POLL_INTERVAL"] = "4"
+    config_module.reset_for_testing(config_path_override=config_file)
+    assert config_module.config.compile_poll_interval == 4.0
+
+
+@pytest.mark.parametrize("env_value", ["abc", "0", "-1"])
+def test_compile_poll_interval_rejects_bad_values(env_value: str, tmp_path: Path, monkeypatch):
+    """Non-numbers and values <= 0 raise ConfigInvalid instead of a raw ValueError."""
+    monkeypatch.chdir(tmp_path)
+    os.environ["BASH2YAML_POLL_INTERVAL"] = env_value
+    config_module.reset_for_testing()
+
+    with pytest.raises(ConfigInvalid):
+        _ = config_module.config.compile_poll_interval
@@ -135,3 +135,22 @@ template_job:
             assert "variables" in template_data
         finally:
             del os.environ["BASH2YAML_SKIP_ROOT_CHECKS"]
+
+    def test_progress_callback_reports_each_file_and_can_stop_the_run(self, setup_project_structure, monkeypatch):
+        monkeypatch.setenv("BASH2YAML_SKIP_ROOT_CHECKS", "True")
+        input_dir, output_path = setup_project_structure
+        seen = []
+
+        run_compile_all(input_dir, output_path, force=True, progress_callback=lambda *args: seen.append(args))
+
+        assert [(done, total) for done, total, _ in seen] == [(1, 2), (2, 2)]
+        assert {source.name for _, _, source in seen} == {".gitlab-ci.yml", "backend.yml"}
+
+        class Stop(Exception):
+            pass
+
+        def stop(done, total, source):
+            raise Stop()
+
+        with pytest.raises(Stop):
+            run_compile_all(input_dir, output_path, force=True, progress_callback=stop)
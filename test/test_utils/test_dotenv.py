@@ -149,3 +149,24 @@ def test_regex_patterns():
             ), f"Test {i + 1}: Expected value '{expected_value}', got '{match.group('value')}'"
         else:
             assert match is None, f"Test {i + 1}: '{test_input}' should not match but did"
+
+
+def test_parser_edge_cases():
+    """Test the scanner agrees with the assignment pattern on tricky lines"""
+    test_cases = [
+        ("export=value", {"export": "value"}),  # 'export' alone is a valid key
+        ("exportKEY=value", {"exportKEY": "value"}),
+        ("export\tTABBED=value", {"TABBED": "value"}),
+        ("KEY = value", {}),  # No spaces allowed before '='
+        ("KEY-NAME=value", {}),
+        ("KÉY=value", {}),  # Keys are ASCII only
+        ("=value", {}),
+        ("export KEY", {}),
+        ("KEY='mismatched\"", {"KEY": "'mismatched\""}),
+        ('KEY="  padded  "', {"KEY": "  padded  "}),
+        ("KEY=1\r\nOTHER=2\r\n", {"KEY": "1", "OTHER": "2"}),
+        ("KEY=1\nKEY=2", {"KEY": "2"}),
+    ]
+
+    for test_input, expected in test_cases:
+        assert parse_env_file(test_input) == expected, test_input
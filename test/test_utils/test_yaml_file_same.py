@@ -30,6 +30,10 @@ from bash2yaml.utils.yaml_file_same import normalize_for_compare, yaml_is_same
         ("   \n\t\n  ", ""),
         # Test case 11: A more complex, combined example
         ("  key: value  \r\nlist:\r  - item1\t\n  - item2\n\n\n", "key: value\nlist:\n  - item1\n  - item2"),
+        # Test case 12: Internal blank lines are kept
+        ("a\n\n\nb\n", "a\n\n\nb"),
+        # Test case 13: Other str.splitlines() separators also end lines
+        ("a \x0cb\u2028c", "a\nb\nc"),
     ],
 )
 def test_normalize_for_compare(input_text, expected_text):
@@ -144,6 +148,19 @@ def create_dummy_factory(tmp_path):
     return factory_path
 
 
+def test_yaml_is_same_identical_text_skips_parsing(monkeypatch):
+    """Byte-identical content is equal without normalizing or loading YAML."""
+
+    def no_parse():
+        raise AssertionError("YAML should not be parsed for identical content")
+
+    monkeypatch.setattr("bash2yaml.utils.yaml_file_same.get_yaml", no_parse)
+    content = "a: 1\nlist: [x, y]\n"
+
+    assert yaml_is_same(content, content)
+    assert yaml_is_same(content, content[:-1] + "\n")  # equal, but a different object
+
+
 # This is an example of how you might use tmp_path if you needed to write files,
 # though for these specific tests, it's not strictly necessary unless you are
 # setting up a temporary project structure for imports.
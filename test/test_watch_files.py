@@ -1,19 +1,85 @@
 from __future__ import annotations
 
+import os
+import threading
 import types
 
+import pytest
+
 from bash2yaml.watch_files import _RecompileHandler, start_watch
 
 
 class _Evt:
     """Tiny stand-in for watchdog FileSystemEvent."""
 
-    def __init__(self, src_path: str, is_directory: bool = False):
+    def __init__(self, src_path: str, is_directory: bool = False, dest_path: str = ""):
         self.src_path = src_path
         self.is_directory = is_directory
+        self.dest_path = dest_path
+
+
+class _FakeThread:
+    """threading.Thread stand-in; tests drive the worker by hand."""
+
+    instances: list[_FakeThread] = []
+
+    def __init__(self, target, name=None, daemon=None):
+        self.target = target
+        self.name = name
+        self.daemon = daemon
+        self.started = False
+        _FakeThread.instances.append(self)
+
+    def start(self):
+        self.started = True
+
+
+class _FakeEvent:
+    """threading.Event stand-in whose wait() returns at once but records the timeout."""
+
+    def __init__(self):
+        self.flag = False
+        self.waits: list[float] = []
+
+    def set(self):
+        self.flag = True
+
+    def is_set(self):
+        return self.flag
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        return self.flag
 
 
-def test_handler_ignores_dirs_and_irrelevant_extensions(tmp_path, monkeypatch):
+@pytest.fixture(autouse=True)
+def fake_thread(monkeypatch):
+    _FakeThread.instances = []
+    monkeypatch.setattr(
+        "bash2yaml.watch_files.threading",
+        types.SimpleNamespace(Lock=threading.Lock, Thread=_FakeThread, Event=_FakeEvent),
+    )
+    return _FakeThread
+
+
+class _Clock:
+    """Manually advanced stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr("bash2yaml.watch_files.time", types.SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+def test_handler_ignores_dirs_and_irrelevant_extensions(tmp_path, monkeypatch, fake_thread):
     called = {"count": 0}
 
     def fake_compile(**kwargs):
@@ -27,23 +93,63 @@ def test_handler_ignores_dirs_and_irrelevant_extensions(tmp_path, monkeypatch):
         dry_run=False,
         parallelism=None,
     )
-    handler._debounce = 0.0  # avoid timing flake
 
     # Directory -> ignored
-    handler.on_any_event(_Evt(str(tmp_path), is_directory=True))
+    handler.on_created(_Evt(str(tmp_path), is_directory=True))
 
     # Temp files -> ignored
-    handler.on_any_event(_Evt(str(tmp_path / "foo.yml.swp")))
-    handler.on_any_event(_Evt(str(tmp_path / "bar.tmp")))
-    handler.on_any_event(_Evt(str(tmp_path / "baz~")))
+    handler.on_created(_Evt(str(tmp_path / "foo.yml.swp")))
+    handler.on_created(_Evt(str(tmp_path / "bar.tmp")))
+    handler.on_created(_Evt(str(tmp_path / "baz~")))
 
     # Irrelevant extension -> ignored
-    handler.on_any_event(_Evt(str(tmp_path / "note.txt")))
+    handler.on_created(_Evt(str(tmp_path / "note.txt")))
 
-    # Behavior: no compile should have been triggered
+    # Behavior: nothing queued, and flushing does not compile
+    assert handler._pending == set()
+    assert fake_thread.instances == []
+    handler._flush()
     assert called["count"] == 0
 
 
+@pytest.mark.parametrize(
+    ("name", "accepted"),
+    [
+        ("ci.yml", True),
+        ("ci.yaml", True),
+        ("build.sh", True),
+        ("build.bash", True),
+        ("ci.yml.swp", False),
+        ("ci.yml~", False),
+        ("build.sh.tmp", False),
+        ("Makefile", False),
+        ("conf.d/notes", False),
+        ("ci.yml.bak", False),
+    ],
+)
+def test_handler_suffix_filter(tmp_path, monkeypatch, name, accepted):
+    monkeypatch.setattr("bash2yaml.watch_files.run_compile_all", lambda **_: None)
+    handler = _RecompileHandler(input_dir=tmp_path, output_path=tmp_path / "out")
+
+    handler.on_created(_Evt(str(tmp_path / name)))
+
+    assert (handler._pending == {str(tmp_path / name)}) is accepted
+
+
+def test_handler_keeps_event_paths_as_plain_strings(tmp_path, monkeypatch):
+    monkeypatch.setattr("bash2yaml.watch_files.run_compile_all", lambda **_: None)
+    handler = _RecompileHandler(input_dir=tmp_path, output_path=tmp_path / "out")
+    target = str(tmp_path / "ci.yml")
+
+    # Behavior: watchdog may report bytes paths; they decode to the same str key
+    handler.on_created(_Evt(os.fsencode(target)))
+    handler.on_modified(_Evt(target))
+
+    assert handler._pending == {target}
+    assert handler._tracked == {target}
+    assert all(type(p) is str for p in handler._pending)
+
+
 def test_handler_triggers_on_yaml_and_sh(tmp_path, monkeypatch):
     recorded = {"kwargs": None, "call_count": 0}
 
@@ -59,10 +165,10 @@ def test_handler_triggers_on_yaml_and_sh(tmp_path, monkeypatch):
         dry_run=True,
         parallelism=4,
     )
-    handler._debounce = 0.0  # fire immediately
 
     # Behavior: should trigger compile for .yml with correct parameters
-    handler.on_any_event(_Evt(str(tmp_path / "pipeline.yml")))
+    handler.on_created(_Evt(str(tmp_path / "pipeline.yml")))
+    handler._flush()
     assert recorded["call_count"] == 1
     assert recorded["kwargs"]["input_dir"] == tmp_path
     assert recorded["kwargs"]["output_path"] == tmp_path / "out"
@@ -70,24 +176,46 @@ def test_handler_triggers_on_yaml_and_sh(tmp_path, monkeypatch):
     assert recorded["kwargs"]["parallelism"] == 4
 
     # Behavior: should trigger compile for .sh files too
-    handler.on_any_event(_Evt(str(tmp_path / "script.sh")))
+    handler.on_created(_Evt(str(tmp_path / "script.sh")))
+    handler._flush()
     assert recorded["call_count"] == 2
 
 
-def test_handler_debounce(monkeypatch, tmp_path):
+def test_handler_hands_events_to_a_single_worker(tmp_path, monkeypatch, fake_thread):
     calls = {"n": 0}
 
     def fake_compile(**kwargs):
         calls["n"] += 1
 
-    # Control time.monotonic so we can test the debounce window deterministically
-    times = [100.0, 100.3, 101.0]  # first call at 100, second inside 0.5s, third outside
+    monkeypatch.setattr("bash2yaml.watch_files.run_compile_all", fake_compile)
+    handler = _RecompileHandler(input_dir=tmp_path, output_path=tmp_path / "out")
+
+    handler.on_created(_Evt(str(tmp_path / "a.yaml")))
+    handler.on_created(_Evt(str(tmp_path / "b.yaml")))
+    handler.on_modified(_Evt(str(tmp_path / "a.yaml")))
+
+    # Behavior: callbacks never compile; one daemon worker is started on first use
+    assert calls["n"] == 0
+    assert len(fake_thread.instances) == 1
+    worker = fake_thread.instances[0]
+    assert worker.started and worker.daemon and worker.target == handler._run
+    # Behavior: the one-slot wake-up queue collapses the burst to a single wake-up
+    assert handler._wakeup.qsize() == 1
+    assert handler._pending == {str(tmp_path / "a.yaml"), str(tmp_path / "b.yaml")}
+
+    # Behavior: cancel() stops the worker before it compiles anything
+    handler.cancel()
+    handler._run()
+    assert calls["n"] == 0
+
 
-    def fake_monotonic():
-        return times.pop(0)
+def test_handler_compiles_leading_edge_then_batches_burst(monkeypatch, tmp_path, clock):
+    calls = {"n": 0}
+
+    def fake_compile(**kwargs):
+        calls["n"] += 1
 
     monkeypatch.setattr("bash2yaml.watch_files.run_compile_all", fake_compile)
-    monkeypatch.setattr("bash2yaml.watch_files.time", types.SimpleNamespace(monotonic=fake_monotonic))
 
     handler = _RecompileHandler(
         input_dir=tmp_path,
@@ -95,14 +223,84 @@ def test_handler_debounce(monkeypatch, tmp_path):
         dry_run=False,
         parallelism=None,
     )
-    # keep default debounce 0.5s
-
-    handler.on_any_event(_Evt(str(tmp_path / "a.yaml")))  # fires
-    handler.on_any_event(_Evt(str(tmp_path / "b.yaml")))  # within 0.5s -> skipped
-    handler.on_any_event(_Evt(str(tmp_path / "c.yaml")))  # after 0.5s -> fires
+    # keep default max_batch 0.5s / min_gap 0.05s
+
+    # Behavior: first change after a quiet spell compiles as soon as the worker wakes
+    handler.on_created(_Evt(str(tmp_path / "a.yaml")))
+    handler._wakeup.get_nowait()
+    handler._process_wakeup()
+    assert calls["n"] == 1
+    assert handler._stopping.waits == []
+
+    # Behavior: changes right behind it wait out the batch window, then compile together
+    handler.on_created(_Evt(str(tmp_path / "b.yaml")))
+    handler.on_modified(_Evt(str(tmp_path / "a.yaml")))
+    clock.now += 0.01
+    handler._wakeup.get_nowait()
+    handler._process_wakeup()
+    # Held until max_batch after the leading compile
+    assert handler._stopping.waits == [pytest.approx(0.49)]
+    assert calls["n"] == 2
+    assert handler._pending == set()
 
+    # Behavior: a stray second flush with nothing pending is a no-op
+    handler._flush()
     assert calls["n"] == 2
 
+    # Behavior: after a quiet spell the next change is leading-edge again
+    clock.now += 5
+    handler.on_modified(_Evt(str(tmp_path / "b.yaml")))
+    handler._wakeup.get_nowait()
+    handler._process_wakeup()
+    assert calls["n"] == 3
+    assert len(handler._stopping.waits) == 1
+
+
+def test_handler_only_reacts_to_tracked_files(tmp_path, monkeypatch, clock):
+    compiled = []
+    monkeypatch.setattr("bash2yaml.watch_files.run_compile_all", lambda **_: compiled.append(1))
+
+    (tmp_path / "jobs").mkdir()
+    (tmp_path / "jobs" / "build.sh").write_text("echo hi\n", encoding="utf-8")
+    (tmp_path / "ci.yml").write_text("a: 1\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("docs\n", encoding="utf-8")
+
+    handler = _RecompileHandler(input_dir=tmp_path, output_path=tmp_path / "out")
+    handler.track_tree(str(tmp_path))
+    build_sh = str(tmp_path / "jobs" / "build.sh")
+    ci_yml = str(tmp_path / "ci.yml")
+    assert handler._tracked == {build_sh, ci_yml}
+
+    def step(method, *args, **kwargs):
+        # Space events out so each one compiles on the leading edge
+        clock.now += 10
+        method(_Evt(*args, **kwargs))
+        handler._process_wakeup()
+        return len(compiled)
+
+    # Behavior: modifications only count for tracked sources
+    assert step(handler.on_modified, str(tmp_path / "README.md")) == 0
+    assert step(handler.on_modified, str(tmp_path / "other.yml")) == 0
+    assert step(handler.on_modified, ci_yml) == 1
+
+    # Behavior: deletes stop tracking and recompile
+    assert step(handler.on_deleted, ci_yml) == 2
+    assert step(handler.on_modified, ci_yml) == 2
+
+    # Behavior: editor save-by-rename of a temp file onto a source is picked up
+    assert step(handler.on_moved, str(tmp_path / ".ci.yml.swp"), dest_path=ci_yml) == 3
+    assert ci_yml in handler._tracked
+
+    # Behavior: moving a directory re-homes the files tracked beneath it
+    (tmp_path / "jobs").rename(tmp_path / "tasks")
+    moved_sh = str(tmp_path / "tasks" / "build.sh")
+    assert step(handler.on_moved, str(tmp_path / "jobs"), is_directory=True, dest_path=str(tmp_path / "tasks")) == 4
+    assert handler._tracked == {ci_yml, moved_sh}
+
+    # Behavior: deleting a directory forgets everything under it
+    assert step(handler.on_deleted, str(tmp_path / "tasks"), is_directory=True) == 5
+    assert handler._tracked == {ci_yml}
+
 
 def test_handler_handles_exception_gracefully(tmp_path, monkeypatch):
     exception_raised = {"value": False}
@@ -119,20 +317,32 @@ def test_handler_handles_exception_gracefully(tmp_path, monkeypatch):
         dry_run=False,
         parallelism=None,
     )
-    handler._debounce = 0.0
 
     # Behavior: handler should catch and handle exceptions without crashing
-    handler.on_any_event(_Evt(str(tmp_path / "bad.yml")))
+    handler.on_created(_Evt(str(tmp_path / "bad.yml")))
+    handler._flush()
     assert exception_raised["value"] is True
 
 
-def test_start_watch_wires_observer_and_stops_on_keyboardinterrupt(tmp_path, monkeypatch):
+@pytest.mark.parametrize(
+    ("poll_interval", "expected_kind"),
+    [
+        (None, "native"),
+        (3.0, "polling"),
+    ],
+)
+def test_start_watch_wires_observer_and_stops_on_keyboardinterrupt(tmp_path, monkeypatch, poll_interval, expected_kind):
+    created = {}
     scheduled = {"args": None, "recursive": None}
     started = {"value": False}
     stopped = {"value": False}
-    joined = {"value": False}
+    joined = {"calls": 0}
 
     class FakeObserver:
+        def __init__(self, **kwargs):
+            created["kind"] = "native"
+            created["kwargs"] = kwargs
+
         def schedule(self, handler, path, recursive: bool):
             scheduled["args"] = (handler, path)
             scheduled["recursive"] = recursive
@@ -143,37 +353,50 @@ def test_start_watch_wires_observer_and_stops_on_keyboardinterrupt(tmp_path, mon
         def stop(self):
             stopped["value"] = True
 
-        def join(self):
-            joined["value"] = True
-
-    # Patch Observer used by start_watch
-    monkeypatch.setattr("bash2yaml.watch_files.Observer", FakeObserver)
+        def is_alive(self):
+            return True
 
-    # Make the main loop raise KeyboardInterrupt immediately after start
-    sleep_calls = {"n": 0}
+        def join(self, timeout=None):
+            joined["calls"] += 1
+            # The first join is the blocking wait in start_watch; simulate Ctrl-C there.
+            if joined["calls"] == 1:
+                raise KeyboardInterrupt
 
-    def fake_sleep(_):
-        sleep_calls["n"] += 1
-        raise KeyboardInterrupt
+    class FakePollingObserver(FakeObserver):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            created["kind"] = "polling"
 
-    monkeypatch.setattr("bash2yaml.watch_files.time", types.SimpleNamespace(sleep=fake_sleep))
+    # Patch the observers used by start_watch
+    monkeypatch.setattr("bash2yaml.watch_files.Observer", FakeObserver)
+    monkeypatch.setattr("bash2yaml.watch_files.PollingObserver", FakePollingObserver)
 
     # Patch run_compile_all so it's not accidentally called here
     monkeypatch.setattr("bash2yaml.watch_files.run_compile_all", lambda **_: None)
 
+    # All existing sources live in one subdirectory; the watch must still cover input_dir
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "templates" / "a.yml").write_text("a: 1\n", encoding="utf-8")
+
     # Call start_watch: it should start, then promptly stop due to KeyboardInterrupt
     start_watch(
         input_dir=tmp_path,
         output_path=tmp_path / "compiled",
         dry_run=False,
         parallelism=None,
+        poll_interval=poll_interval,
     )
 
+    # Behavior: native events by default, polling when an interval is given
+    assert created["kind"] == expected_kind
+    if expected_kind == "polling":
+        assert created["kwargs"] == {"timeout": poll_interval}
     # Behavior: observer lifecycle should be correct
     assert started["value"] is True
     assert stopped["value"] is True
-    assert joined["value"] is True
-    # Behavior: scheduled on the provided input_dir, recursive=True
+    # Once for the interrupted wait, once more after stop()
+    assert joined["calls"] == 2
+    # Behavior: scheduled on the provided input_dir (not the sources' subtree), recursive=True
     assert scheduled["args"] is not None
     assert scheduled["args"][1] == str(tmp_path)
     assert scheduled["recursive"] is True
@@ -1,6 +1,6 @@
 import pytest
 
-from bash2yaml.utils.yaml_file_same_faster import normalize_for_compare, yaml_is_same
+from yaml_file_same_faster import normalize_for_compare, yaml_is_same
 
 # --- Tests for normalize_for_compare ---
 
@@ -40,6 +40,10 @@ def test_normalize_for_compare(input_text, expected_text):
     assert normalize_for_compare(input_text) == expected_text
 
 
+def test_normalize_for_compare_is_the_single_pass_version():
+    assert normalize_for_compare("a  \r\n") == "a"
+
+
 # --- Tests for yaml_is_same ---
 
 # Simple YAML content for testing
@@ -156,6 +160,6 @@ def test_with_dummy_factory(tmp_path, monkeypatch):
     create_dummy_factory(tmp_path)
 
     # Re-import the function now that the dummy module is in the path
-    from bash2yaml.utils.yaml_file_same import yaml_is_same
+    from yaml_file_same_faster import yaml_is_same
 
     assert yaml_is_same("a: 1", "a: 1")
@@ -1,19 +1,44 @@
 from __future__ import annotations
 
+import functools
+import re
+import sys
 from typing import Any
 
 import ryml
 
-
 # --- scalar casting (conservative, extend as needed) -------------------------
-def _cast_scalar(s: str) -> Any:
-    t = s.strip()
-    if t in ("null", "~", "Null", "NULL", ""):
-        return None
-    if t in ("true", "True", "TRUE"):
-        return True
-    if t in ("false", "False", "FALSE"):
-        return False
+_MISSING = object()
+
+_LITERALS: dict[str, Any] = {
+    "null": None,
+    "~": None,
+    "Null": None,
+    "NULL": None,
+    "": None,
+    "true": True,
+    "True": True,
+    "TRUE": True,
+    "false": False,
+    "False": False,
+    "FALSE": False,
+}
+
+# Classifies the common numeric spellings in one match so no exception is raised for them.
+_NUM_RE = re.compile(
+    r"(?P<hex>0[xX][0-9a-fA-F]+)"
+    r"|(?P<oct>0[oO][0-7]+)"
+    r"|(?P<bin>0[bB][01]+)"
+    r"|(?P<int>[+-]?[0-9]+)"
+    r"|(?P<flt>[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?|[+-]?[0-9]+[eE][+-]?[0-9]+)"
+)
+_INT_BASES = {"hex": 16, "oct": 8, "bin": 2, "int": 10}
+
+# First characters of anything int()/float() might still accept (underscores, "inf", "nan", ...).
+_NUMERIC_LEADS = frozenset("0123456789+-.iInN")
+
+
+def _cast_scalar_slow(s: str, t: str) -> Any:
     # int?
     try:
         if t.startswith(("0x", "0X")):
@@ -33,55 +58,130 @@ def _cast_scalar(s: str) -> Any:
     return s
 
 
+# Kept in pure Python: the package builds as a pure-Python hatchling wheel, and a
+# compiled (Cython/cffi) variant would need per-platform wheels for a few tenths
+# of a microsecond per scalar once the literal table and regex have done their job.
+#
+def _cast_scalar_uncached(s: str) -> Any:
+    t = s.strip()
+    lit = _LITERALS.get(t, _MISSING)
+    if lit is not _MISSING:
+        return lit
+    m = _NUM_RE.fullmatch(t)
+    if m is not None:
+        kind = m.lastgroup
+        if kind == "flt":
+            return float(t)
+        return int(t, _INT_BASES[kind])  # type: ignore[index]
+    lead = t[0]
+    if lead in _NUMERIC_LEADS or not lead.isascii():
+        return _cast_scalar_slow(s, t)
+    return s
+
+
+# Cached because CI files repeat a small vocabulary (`always`, `on_success`, 0/1,
+# image tags) across every job. Keyed on the raw ``s`` so the strip() inside stays
+# consistent, and safe to share since every result is an immutable scalar. Only
+# strings up to `_INTERN_MAX` go through it, so 4096 entries stay well under 1 MiB;
+# long script lines rarely repeat and would only pin their text in the cache.
+_cast_scalar_cached = functools.lru_cache(maxsize=4096)(_cast_scalar_uncached)
+
+
+def _cast_scalar(s: str) -> Any:
+    if len(s) <= _INTERN_MAX:
+        return _cast_scalar_cached(s)
+    return _cast_scalar_uncached(s)
+
+
 def _b2s(b: bytes | bytearray | memoryview) -> str:
-    return (b if isinstance(b, (bytes, bytearray, memoryview)) else bytes(b)).decode("utf-8")
+    # str(buf, encoding) decodes any buffer in place: no isinstance probe and,
+    # for the memoryviews ryml hands back, no intermediate bytes copy.
+    return str(b, "utf-8")
 
 
 # --- ryml -> native ----------------------------------------------------------
-def _node_to_obj(tree: ryml.Tree, node_id: int, cast_scalars: bool) -> Any:
-    if tree.is_map(node_id):
-        out: dict[str, Any] = {}
-        for ch in ryml.children(tree, node_id):
-            k = _b2s(tree.key(ch))
-            if tree.has_val(ch) and not tree.has_children(ch):
-                v = _b2s(tree.val(ch))
-                out[k] = _cast_scalar(v) if cast_scalars else v
-            else:
-                # map/seq as value -> first child is the value node
-                out[k] = _node_to_obj(tree, tree.first_child(ch), cast_scalars)
-        return out
-
-    if tree.is_seq(node_id):
-        items: list[Any] = []
-        for ch in ryml.children(tree, node_id):
-            if tree.is_val(ch) and not tree.has_children(ch):
-                v = _b2s(tree.val(ch))
-                items.append(_cast_scalar(v) if cast_scalars else v)
-            else:
-                items.append(_node_to_obj(tree, ch, cast_scalars))
-        return items
-
-    if tree.is_val(node_id):
-        v = _b2s(tree.val(node_id))
-        return _cast_scalar(v) if cast_scalars else v
-
-    return None  # empty
+# Scalars up to this length are interned: CI files repeat a small vocabulary
+# (stage names, `when:` values, image tags). Long script lines are left alone.
+_INTERN_MAX = 32
+
+
+def _walk(tree: ryml.Tree, node_id: int, cast_scalars: bool) -> Any:
+    """
+    Convert the subtree at ``node_id`` to dict/list/scalars without recursing.
+
+    Containers are created empty, linked into their parent, and pushed on a
+    worklist as ``(parent, key_or_index, node)``; scalars are filled in directly.
+    Deeply nested input can't hit the recursion limit this way.
+    """
+    # The per-node work is tiny, so bind the tree's methods once instead of
+    # resolving attributes on the extension object for every node.
+    is_map = tree.is_map
+    is_seq = tree.is_seq
+    has_val = tree.has_val
+    key = tree.key
+    val = tree.val
+    children = ryml.children
+    b2s = _b2s
+    cast = _cast_scalar if cast_scalars else None
+
+    intern = sys.intern
+
+    def scalar(n: int) -> Any:
+        raw = val(n)
+        v = "" if raw is None else b2s(raw)  # `key:` with nothing after it has no val
+        if cast:
+            obj = cast(v)
+            if obj is not v:
+                return obj
+        return intern(v) if len(v) <= _INTERN_MAX else v
+
+    root: list[Any] = [None]
+    work: list[tuple[Any, Any, int]] = [(root, 0, node_id)]
+    push = work.append
+    pop = work.pop
+    while work:
+        parent, slot, node = pop()
+        if is_map(node):
+            out: dict[str, Any] = {}
+            parent[slot] = out
+            for ch in children(tree, node):
+                k = intern(b2s(key(ch)))
+                if is_map(ch) or is_seq(ch):
+                    out[k] = None  # placeholder keeps key order
+                    push((out, k, ch))
+                else:
+                    out[k] = scalar(ch)
+        elif is_seq(node):
+            # Plain appends on purpose: [None] * num_children plus indexed stores
+            # benchmarked slower on CPython, whose list growth is already amortized.
+            items: list[Any] = []
+            parent[slot] = items
+            for ch in children(tree, node):
+                if is_map(ch) or is_seq(ch):
+                    push((items, len(items), ch))
+                    items.append(None)
+                else:
+                    items.append(scalar(ch))
+        elif has_val(node):
+            parent[slot] = scalar(node)
+        # else: empty document, leave None
+    return root[0]
 
 
 def loads(src: str, *, cast_scalars: bool = True) -> Any:
     """
     Return dict/list/str/None for single-doc YAML, or a list[...] for multi-doc YAML.
     """
-    tree = ryml.parse_in_arena(src.encode("utf-8"))
+    # Parse straight out of a mutable buffer: ryml carves tokens in place instead
+    # of copying the source into its arena. `buf` must outlive every read of `tree`.
+    buf = bytearray(src, "utf-8")
+    tree = ryml.parse_in_place(buf)
     root = tree.root_id()
 
     # If the tree has multiple DOC children, return a list of parsed docs.
     if tree.has_children(root) and all(tree.is_doc(ch) for ch in ryml.children(tree, root)):
-        return [
-            _node_to_obj(tree, tree.first_child(doc), cast_scalars) if tree.has_children(doc) else None
-            for doc in ryml.children(tree, root)
-        ]
+        # A DOC node is itself the map/seq/scalar holding the document.
+        return [_walk(tree, doc, cast_scalars) for doc in ryml.children(tree, root)]
 
     # Single-doc or bare map/seq/scalar at root:
-    node = tree.first_child(root) if tree.is_doc(root) and tree.has_children(root) else root
-    return _node_to_obj(tree, node, cast_scalars)
+    return _walk(tree, root, cast_scalars)
@@ -1,59 +1,100 @@
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 import ryml  # module name: ryml
 
-from bash2yaml.utils.yaml_file_same import normalize_for_compare
-
-# keep your existing helpers
-# normalize_for_compare(...)
 # (removed) get_yaml(), YAMLError
 
 
+def normalize_for_compare(text: str) -> str:
+    """Normalize whitespace and line endings for text comparison.
+
+    Vendored copy of ``bash2yaml.utils.yaml_file_same.normalize_for_compare``
+    (the canonical version; keep the two in sync) so this module stands alone.
+
+    Examples:
+        >>> normalize_for_compare("a  \\r\\nb\\n\\n")
+        'a\\nb'
+    """
+    # splitlines() handles \r\n and bare \r; the final strip() drops blank lines at EOF.
+    return "\n".join(map(str.rstrip, text.splitlines())).strip(" \n")
+
+
+# Scalars up to this length are interned so repeated CI vocabulary shares one
+# object and equality checks hit the identity fast path.
+_INTERN_MAX = 32
+
+
+def _never(_node: int) -> bool:
+    return False
+
+
 def _ryml_to_obj(tree: ryml.Tree, node: int) -> Any:
     """
     Convert a ryml node (map/seq/scalar) into plain Python
-    structures (dict/list/str) for order-insensitive equality.
+    structures (dict/list/str). Mapping key order is kept as parsed; ``==`` on
+    dicts ignores it, so comparisons are still order-insensitive.
+
+    Walks an explicit worklist instead of recursing, so deeply nested
+    input costs no Python frames and can't hit the recursion limit.
     """
-    # maps
-    if getattr(tree, "is_map", None) and tree.is_map(node):
-        out: dict[str, Any] = {}
-        for ch in ryml.children(tree, node):
-            k = tree.key(ch)
-            k_s = (k if isinstance(k, (bytes, bytearray, memoryview)) else bytes(k)).decode("utf-8")
-            # child can be key+scalar, key+map, or key+seq
-            if tree.has_val(ch) and not tree.has_children(ch):
-                v = tree.val(ch)
-                v_s = (v if isinstance(v, (bytes, bytearray, memoryview)) else bytes(v)).decode("utf-8")
-                out[k_s] = v_s
-            else:
-                # value is a nested map/seq under this child
-                # value node is the first child of ch
-                val_node = tree.first_child(ch)
-                out[k_s] = _ryml_to_obj(tree, val_node)
-        # sort keys to make mapping order irrelevant for equality
-        return {k: out[k] for k in sorted(out.keys())}
-
-    # sequences
-    if getattr(tree, "is_seq", None) and tree.is_seq(node):
-        items: list[Any] = []
-        for ch in ryml.children(tree, node):
-            if tree.is_val(ch) and not tree.has_children(ch):
-                v = tree.val(ch)
-                v_s = (v if isinstance(v, (bytes, bytearray, memoryview)) else bytes(v)).decode("utf-8")
-                items.append(v_s)
-            else:
-                items.append(_ryml_to_obj(tree, ch))
-        return items
-
-    # scalar value (root could also be a bare scalar doc)
-    if tree.is_val(node):
-        v = tree.val(node)
-        return (v if isinstance(v, (bytes, bytearray, memoryview)) else bytes(v)).decode("utf-8")
-
-    # empty doc / nothing
-    return None
+    # Resolve the tree's methods (and whether it has them at all) once,
+    # not per node.
+    is_map = getattr(tree, "is_map", None) or _never
+    is_seq = getattr(tree, "is_seq", None) or _never
+    has_val = tree.has_val
+    key = tree.key
+    val = tree.val
+    children = ryml.children
+    intern = sys.intern
+
+    def scalar(n: int) -> str:
+        v = val(n)
+        if v is None:  # `key:` with nothing after it
+            return ""
+        # decode the buffer ryml hands back directly, without copying it to bytes
+        s = str(v, "utf-8")
+        return intern(s) if len(s) <= _INTERN_MAX else s
+
+    root: list[Any] = [None]
+    work: list[tuple[Any, Any, int]] = [(root, 0, node)]
+    push = work.append
+    pop = work.pop
+    while work:
+        parent, slot, n = pop()
+        # maps
+        if is_map(n):
+            # no key sorting needed: dict equality already ignores insertion order
+            out: dict[str, Any] = {}
+            parent[slot] = out
+            for ch in children(tree, n):
+                k_s = intern(str(key(ch), "utf-8"))
+                # child can be key+scalar, key+map, or key+seq
+                if is_map(ch) or is_seq(ch):
+                    out[k_s] = None  # placeholder, filled when ch is popped
+                    push((out, k_s, ch))
+                else:
+                    out[k_s] = scalar(ch)
+
+        # sequences
+        elif is_seq(n):
+            items: list[Any] = []
+            parent[slot] = items
+            for ch in children(tree, n):
+                if is_map(ch) or is_seq(ch):
+                    push((items, len(items), ch))
+                    items.append(None)
+                else:
+                    items.append(scalar(ch))
+
+        # scalar value (root could also be a bare scalar doc)
+        elif has_val(n):
+            parent[slot] = scalar(n)
+
+        # empty doc / nothing: leave None
+    return root[0]
 
 
 def _parse_with_ryml(s: str) -> Any:
@@ -61,17 +102,25 @@ def _parse_with_ryml(s: str) -> Any:
     Parse YAML string into a normalized Python structure using ryml.
     ryml requires bytes/bytearray input.
     """
-    # immutable parse that owns its arena
-    tree = ryml.parse_in_arena(s.encode("utf-8"))
+    # parse in place from a mutable buffer rather than copying the encoded text
+    # into ryml's arena; `buf` stays referenced until the walk below is done
+    buf = bytearray(s, "utf-8")
+    tree = ryml.parse_in_place(buf)
     root = tree.root_id()
-    # some inputs are a map/seq directly at root, others are a doc node
-    # if the root is a DOC container, drill into first child
-    if getattr(tree, "is_doc", None) and tree.is_doc(root) and tree.has_children(root):
-        return _ryml_to_obj(tree, tree.first_child(root))
+    # explicit `---` documents hang off the root as DOC nodes; a DOC node is
+    # itself the map/seq/scalar holding the document
+    if tree.has_children(root) and all(tree.is_doc(ch) for ch in ryml.children(tree, root)):
+        docs = [_ryml_to_obj(tree, doc) for doc in ryml.children(tree, root)]
+        return docs[0] if len(docs) == 1 else docs
     return _ryml_to_obj(tree, root)
 
 
 def yaml_is_same(current_content: str, new_content: str) -> bool:
+    # 0) unchanged file (often the very same object): identity, then str ==
+    #    which compares lengths first, then memcmp; no copies
+    if current_content is new_content or current_content == new_content:
+        return True
+
     # 1) quick trims
     if current_content.strip("\n") == new_content.strip("\n"):
         return True
@@ -83,6 +132,9 @@ def yaml_is_same(current_content: str, new_content: str) -> bool:
         return True
 
     # 3) parse & compare via RapidYAML
+    # Parsed one after the other on purpose: the ryml bindings hold the GIL while
+    # parsing (two threads on a 4 MB pipeline took as long as running serially),
+    # and the tree walk is pure Python, so a thread pool would only add overhead.
     try:
         curr_obj = _parse_with_ryml(current_content)
         new_obj = _parse_with_ryml(new_content)
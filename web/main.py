@@ -7,17 +7,31 @@ Provides REST API endpoints for the accessible web UI
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
+import sys
+import time
 import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import orjson
 import uvicorn
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from redis.asyncio import Redis
 
 from bash2yaml.commands.clean_all import clean_targets
 
@@ -25,15 +39,81 @@ from bash2yaml.commands.clean_all import clean_targets
 from bash2yaml.commands.compile_all import run_compile_all
 from bash2yaml.commands.decompile_all import run_decompile_gitlab_tree
 from bash2yaml.commands.lint_all import lint_output_folder, summarize_results
-from bash2yaml.config import config
+from bash2yaml.config import Config, config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Task storage (in production, use Redis or database)
-tasks: dict[str, dict[str, Any]] = {}
+
+def _read_lint_settings(cfg: Config) -> tuple[str, int | None]:
+    return cfg.lint_gitlab_url or "https://gitlab.com", cfg.lint_project_id
+
+
+# Read once; POST /api/v1/config/reload re-reads them after the config file or environment changes
+_LINT_URL, _LINT_PROJECT = _read_lint_settings(config)
+
+# Task storage. With BASH2YAML_REDIS_URL set, task state lives in Redis so every uvicorn
+# worker sees the same tasks; otherwise it is kept in this process.
+REDIS_URL = os.environ.get("BASH2YAML_REDIS_URL")
+TASK_TTL = 86400  # seconds a task's keys outlive their last write
+MAX_LOCAL_TASKS = 100
+# Status responses carry at most this many of a task's newest log lines; the full history (as far
+# as it is kept) is paged through /api/v1/logs so a long run doesn't grow every status payload.
+MAX_TASK_MESSAGES = 200
+FINISHED = ("completed", "failed", "cancelled")
+
+
+@dataclass(frozen=True, slots=True)
+class TaskState:
+    """Snapshot of one task.
+
+    Updates swap a new snapshot into ``tasks`` rather than mutating it, so readers holding a
+    reference never see a half-applied update and iterating ``tasks`` needs no lock.
+    ``messages`` is shared between snapshots and only ever appended to; it keeps the newest
+    MAX_TASK_MESSAGES lines, and ``message_total`` counts every line ever logged.
+    """
+
+    id: str
+    operation: str
+    status: str = "started"
+    progress: int = 0
+    current_step: str | None = None
+    error: str | None = None
+    started_at: datetime = field(default_factory=datetime.now)
+    completed_at: datetime | None = None
+    messages: deque[str] = field(default_factory=lambda: deque(maxlen=MAX_TASK_MESSAGES))
+    message_total: int = 0
+    results: dict[str, Any] = field(default_factory=dict)
+
+
+tasks: dict[str, TaskState] = {}
 configs: dict[str, dict[str, Any]] = {}
+_redis: Redis | None = None
+
+# With BASH2YAML_JOB_QUEUE=arq (and Redis configured) operations are queued for the arq worker
+# in workers.py instead of running in the process that took the request.
+USE_JOB_QUEUE = bool(REDIS_URL) and os.environ.get("BASH2YAML_JOB_QUEUE") == "arq"
+_arq_pool: Any = None
+
+# Compile and decompile are CPU-bound YAML work; running them in worker processes keeps them off
+# the event loop's GIL. Lint and clean are I/O-bound and stay on the default thread executor.
+# Workers are only spawned on first use. Every uvicorn worker imports this module and gets its own
+# pool, so the cores are split between them (BASH2YAML_WEB_WORKERS is set by
+# uvicorn_performance_options; set it yourself when passing --workers to uvicorn directly).
+API_WORKERS = max(1, int(os.environ.get("BASH2YAML_WEB_WORKERS", "1")))
+COMPILE_POOL = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 1) // API_WORKERS))
+
+# Cancel flags and progress queues for compiles running in COMPILE_POOL. Plain threading objects
+# can't reach another process, so these are Manager proxies; the manager is started on first use.
+cancel_events: dict[str, Any] = {}
+_sync_manager: Any = None
+PROGRESS_INTERVAL = 0.1  # seconds between progress reports from a running compile
+
+
+class CompileCancelled(Exception):
+    """Raised inside a pool worker when its task has been cancelled."""
+
 
 app = FastAPI(
     title="bash2yaml API",
@@ -41,6 +121,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # orjson's C encoder for every JSON response, including datetimes, instead of stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Enable CORS for web interface
@@ -64,11 +146,15 @@ class OperationConfig(BaseModel):
 
 
 class ValidationRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     inputDir: str
     outputDir: str
 
 
 class ValidationResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     valid: bool
     errors: list[str] | None = None
     warnings: list[str] | None = None
@@ -76,6 +162,8 @@ class ValidationResponse(BaseModel):
 
 
 class TaskResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     status: str = "started"
     message: str = "Operation initiated"
@@ -92,7 +180,26 @@ class TaskStatus(BaseModel):
     completed_at: datetime | None = None
 
 
+class TaskStatusShort(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    status: str
+    progress: int = Field(default=0, ge=0, le=100)
+    current_step: str | None = None
+
+
+class TaskLogs(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    task_id: str
+    offset: int
+    messages: list[str]
+    next_offset: int
+
+
 class TaskResults(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     summary: str
     files_processed: int | None = None
@@ -111,47 +218,389 @@ class ConfigData(BaseModel):
     language: str = "en"
 
 
+class ConnectionManager:
+    """Pushes task updates to the WebSockets watching each task in this process."""
+
+    def __init__(self) -> None:
+        self.connections: dict[str, set[WebSocket]] = {}
+        # Strong references so in-flight broadcasts aren't garbage collected
+        self._sending: set[asyncio.Task] = set()
+
+    def connect(self, task_id: str, websocket: WebSocket) -> None:
+        self.connections.setdefault(task_id, set()).add(websocket)
+
+    def disconnect(self, task_id: str, websocket: WebSocket) -> None:
+        sockets = self.connections.get(task_id)
+        if sockets is not None:
+            sockets.discard(websocket)
+            if not sockets:
+                del self.connections[task_id]
+
+    async def broadcast(self, task_id: str, payload: str) -> None:
+        """Send one JSON payload to every socket watching ``task_id``; drop sockets that fail."""
+        for websocket in list(self.connections.get(task_id, ())):
+            try:
+                await websocket.send_text(payload)
+            except Exception:  # pylint: disable=broad-except
+                self.disconnect(task_id, websocket)
+
+    def notify(self, task_id: str, payload: str) -> None:
+        """Schedule a broadcast without making the caller wait on slow sockets."""
+        if task_id not in self.connections:
+            return
+        sending = asyncio.create_task(self.broadcast(task_id, payload))
+        self._sending.add(sending)
+        sending.add_done_callback(self._sending.discard)
+
+
+manager = ConnectionManager()
+
+
 # Helper functions
-def create_task(operation: str) -> str:
+def _get_sync_manager() -> Any:
+    global _sync_manager
+    if _sync_manager is None:
+        _sync_manager = multiprocessing.Manager()
+    return _sync_manager
+
+
+def _signal_cancel(task_id: str) -> None:
+    """Tell a compile running for ``task_id`` in this worker to stop at its next file."""
+    event = cancel_events.get(task_id)
+    if event is not None:
+        event.set()
+
+
+async def start_operation(background_tasks: BackgroundTasks, operation: Callable[..., Any], *args: Any) -> None:
+    """Run an operation coroutine after the response, here or on the arq worker.
+
+    Queued jobs are named after the operation function; workers.py registers wrappers with the same names.
+    """
+    global _arq_pool
+    if not USE_JOB_QUEUE:
+        background_tasks.add_task(operation, *args)
+        return
+    if _arq_pool is None:
+        from arq import create_pool
+        from arq.connections import RedisSettings
+
+        _arq_pool = await create_pool(RedisSettings.from_dsn(REDIS_URL))
+    await _arq_pool.enqueue_job(operation.__name__, *args)
+
+
+def get_redis() -> Redis | None:
+    """Return this process's Redis client (one connection pool per worker), or None if unset."""
+    global _redis
+    if REDIS_URL and _redis is None:
+        _redis = Redis.from_url(REDIS_URL, decode_responses=True)
+    return _redis
+
+
+def _to_hash(fields: dict[str, Any]) -> dict[str, str]:
+    """Flatten task fields for HSET; None becomes an empty string, datetimes ISO strings."""
+    out = {}
+    for key, value in fields.items():
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        out[key] = "" if value is None else str(value)
+    return out
+
+
+def _from_hash(raw: dict[str, str]) -> dict[str, Any]:
+    """Inverse of _to_hash for the fields a task hash holds."""
+    task: dict[str, Any] = {key: value or None for key, value in raw.items()}
+    task["progress"] = int(raw.get("progress") or 0)
+    for key in ("started_at", "completed_at"):
+        if task.get(key):
+            task[key] = datetime.fromisoformat(task[key])
+    return task
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+async def publish_event(task_id: str, event: dict[str, Any]) -> None:
+    """Push a task change to WebSocket watchers.
+
+    With Redis the event goes through pub/sub so sockets held by other workers see it too;
+    each worker's listener (see relay_task_events) hands it to its local ConnectionManager.
+    """
+    payload = json.dumps({"task_id": task_id, **event}, default=_json_default)
+    redis = get_redis()
+    if redis is None:
+        manager.notify(task_id, payload)
+    else:
+        await redis.publish(f"task:{task_id}:events", payload)
+
+
+async def relay_task_events(redis: Redis) -> None:
+    """Forward task events published by any worker to the sockets connected to this one."""
+    async with redis.pubsub() as pubsub:
+        await pubsub.psubscribe("task:*:events")
+        async for message in pubsub.listen():
+            if message["type"] != "pmessage":
+                continue
+            task_id = message["channel"].split(":")[1]
+            if task_id in cancel_events and json.loads(message["data"]).get("status") == "cancelled":
+                # The cancel request may have been handled by another worker
+                _signal_cancel(task_id)
+            manager.notify(task_id, message["data"])
+
+
+# Filename classification for the tree walks. str.endswith with a tuple runs in C and measured
+# faster than slicing at rfind(".") and looking the extension up in a dict or set.
+_YAML_SUFFIXES = (".yml", ".yaml")
+_CI_SUFFIX = ".gitlab-ci.yml"  # also matches a bare .gitlab-ci.yml
+
+
+def _scan_gitlab_and_yaml(root: Path) -> tuple[list[Path], list[Path]]:
+    """Walk ``root`` once and return (.gitlab-ci.yml files, all .yml/.yaml files).
+
+    One os.scandir pass classifies names in Python, replacing a separate rglob walk per pattern.
+    """
+    ci_files: list[Path] = []
+    yaml_files: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    if name.endswith(_YAML_SUFFIXES):
+                        yaml_files.append(Path(entry.path))
+                        if name.endswith(_CI_SUFFIX):
+                            ci_files.append(Path(entry.path))
+        except OSError:
+            continue
+    return ci_files, yaml_files
+
+
+# Never part of a compiled tree: VCS metadata, bytecode caches and bash2yaml's own hash bookkeeping
+_SKIP_OUTPUT_DIRS = frozenset({".git", "__pycache__", ".bash2yaml"})
+
+
+def _list_yaml(root: Path) -> list[str]:
+    """Return every .yml/.yaml file under ``root`` as a string path, in one os.walk pass."""
+    found: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_OUTPUT_DIRS]
+        found.extend(os.path.join(dirpath, f) for f in filenames if f.endswith(_YAML_SUFFIXES))
+    return found
+
+
+async def create_task(operation: str) -> str:
     """Create a new task and return its ID"""
     task_id = str(uuid.uuid4())
-    tasks[task_id] = {
-        "id": task_id,
-        "operation": operation,
-        "status": "started",
-        "progress": 0,
-        "current_step": f"Initializing {operation}",
-        "messages": [],
-        "error": None,
-        "started_at": datetime.now(),
-        "completed_at": None,
-        "results": {},
-    }
+    task = TaskState(id=task_id, operation=operation, current_step=f"Initializing {operation}")
+    redis = get_redis()
+    if redis is None:
+        tasks[task_id] = task
+        if len(tasks) > MAX_LOCAL_TASKS:
+            # dicts keep insertion order, so the first key is the oldest task
+            del tasks[next(iter(tasks))]
+        return task_id
+
+    async with redis.pipeline(transaction=False) as pipe:
+        fields = asdict(task)
+        del fields["messages"], fields["message_total"], fields["results"]
+        pipe.hset(f"task:{task_id}", mapping=_to_hash(fields))
+        pipe.expire(f"task:{task_id}", TASK_TTL)
+        pipe.sadd("tasks:index", task_id)
+        await pipe.execute()
     return task_id
 
 
-def update_task(task_id: str, **kwargs):
+async def update_task(task_id: str, **kwargs):
     """Update task status"""
-    if task_id in tasks:
-        tasks[task_id].update(kwargs)
-        if kwargs.get("status") in ["completed", "failed", "cancelled"]:
-            tasks[task_id]["completed_at"] = datetime.now()
+    results = kwargs.pop("results", None)
+    if kwargs.get("status") in FINISHED:
+        kwargs["completed_at"] = datetime.now()
+    if kwargs.get("status") == "cancelled":
+        _signal_cancel(task_id)
+
+    redis = get_redis()
+    if redis is None:
+        task = tasks.get(task_id)
+        if task is not None:
+            if results is not None:
+                tasks[task_id] = replace(task, results=results, **kwargs)
+            else:
+                tasks[task_id] = replace(task, **kwargs)
+            await publish_event(task_id, kwargs)
+        return
+
+    key = f"task:{task_id}"
+    if not await redis.exists(key):
+        return
+    async with redis.pipeline(transaction=False) as pipe:
+        if kwargs:
+            pipe.hset(key, mapping=_to_hash(kwargs))
+        if results:
+            # Values may be lists (output_files, warnings), so store each one as JSON
+            pipe.hset(f"{key}:results", mapping={k: json.dumps(v) for k, v in results.items()})
+        if "completed_at" in kwargs:
+            # Finished tasks expire a day after completion; this replaces the startup cleanup
+            for suffix in ("", ":messages", ":results"):
+                pipe.expire(f"{key}{suffix}", TASK_TTL)
+        await pipe.execute()
+    await publish_event(task_id, kwargs)
+
+
+async def log_task_message(task_id: str, *messages: str):
+    """Add one or more log messages to task in a single write"""
+    if not messages:
+        return
+    redis = get_redis()
+    if redis is None:
+        task = tasks.get(task_id)
+        if task is None:
+            return
+        task.messages.extend(messages)
+        tasks[task_id] = replace(task, message_total=task.message_total + len(messages))
+    else:
+        if not await redis.exists(f"task:{task_id}"):
+            return
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(f"task:{task_id}:messages", *messages)
+            pipe.expire(f"task:{task_id}:messages", TASK_TTL)
+            await pipe.execute()
+    for message in messages:
+        await publish_event(task_id, {"message": message})
+    text = "\n".join(messages)
+    logger.info(f"Task {task_id}: {text}")
+
+
+async def get_task(task_id: str) -> TaskState | None:
+    """Return a task with its messages and results, or None if it is unknown or expired."""
+    redis = get_redis()
+    if redis is None:
+        return tasks.get(task_id)
+
+    key = f"task:{task_id}"
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.hgetall(key)
+        pipe.lrange(f"{key}:messages", -MAX_TASK_MESSAGES, -1)
+        pipe.llen(f"{key}:messages")
+        pipe.hgetall(f"{key}:results")
+        raw, messages, message_total, results = await pipe.execute()
+    if not raw:
+        return None
+    return TaskState(
+        **_from_hash(raw),
+        messages=deque(messages, maxlen=MAX_TASK_MESSAGES),
+        message_total=message_total,
+        results={k: json.loads(v) for k, v in results.items()},
+    )
 
 
-def log_task_message(task_id: str, message: str):
-    """Add a log message to task"""
-    if task_id in tasks:
-        tasks[task_id]["messages"].append(message)
-        logger.info(f"Task {task_id}: {message}")
+async def get_task_logs(task_id: str, offset: int) -> tuple[int, list[str], int] | None:
+    """Return (first offset returned, log lines from there on, total lines logged), or None if unknown.
+
+    Offsets count from the first line ever logged. Redis keeps the whole log; the in-process store
+    only the newest MAX_TASK_MESSAGES lines, so older offsets start at the oldest line still held.
+    """
+    redis = get_redis()
+    if redis is None:
+        task = tasks.get(task_id)
+        if task is None:
+            return None
+        first = task.message_total - len(task.messages)
+        start = max(offset, first)
+        return start, list(islice(task.messages, start - first, None)), task.message_total
+
+    key = f"task:{task_id}"
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.exists(key)
+        pipe.lrange(f"{key}:messages", offset, -1)
+        exists, lines = await pipe.execute()
+    if not exists:
+        return None
+    return offset, lines, offset + len(lines)
+
+
+async def get_task_short(task_id: str) -> dict[str, Any] | None:
+    """Return just a task's status, progress and current step, or None if it is unknown or expired."""
+    redis = get_redis()
+    if redis is None:
+        task = tasks.get(task_id)
+        if task is None:
+            return None
+        return {"status": task.status, "progress": task.progress, "current_step": task.current_step}
+
+    status, progress, current_step = await redis.hmget(f"task:{task_id}", ["status", "progress", "current_step"])
+    if status is None:
+        return None
+    return {"status": status, "progress": int(progress or 0), "current_step": current_step or None}
+
+
+async def iter_tasks(batch_size: int = 500) -> AsyncIterator[TaskState]:
+    """Yield every known task's metadata (without messages or results), a batch at a time."""
+    redis = get_redis()
+    if redis is None:
+        for task in list(tasks.values()):
+            yield task
+        return
+
+    # SSCAN walks the index in slices, so only one batch of hashes is held at a time
+    cursor = 0
+    while True:
+        cursor, task_ids = await redis.sscan("tasks:index", cursor, count=batch_size)
+        if task_ids:
+            async with redis.pipeline(transaction=False) as pipe:
+                for task_id in task_ids:
+                    pipe.hgetall(f"task:{task_id}")
+                hashes = await pipe.execute()
+
+            expired = []
+            for task_id, raw in zip(task_ids, hashes):
+                if raw:
+                    yield TaskState(**_from_hash(raw))
+                else:
+                    expired.append(task_id)
+            if expired:
+                # The hash has expired; drop its id from the index as we go
+                await redis.srem("tasks:index", *expired)
+        if cursor == 0:
+            return
+
+
+def _status_model(task: TaskState) -> TaskStatus:
+    # The server wrote every field itself, so skip validation; messages must already be a list
+    return TaskStatus.model_construct(
+        task_id=task.id,
+        status=task.status,
+        progress=task.progress,
+        current_step=task.current_step,
+        messages=list(task.messages),
+        error=task.error,
+        started_at=task.started_at,
+        completed_at=task.completed_at,
+    )
 
 
 # API Endpoints
 
 
+# The health body never changes, so encode it once and let proxies and browsers cache it briefly
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "bash2yaml-api", "version": "1.0.0"})
+_HEALTH_HEADERS = {
+    "ETag": f'"{hashlib.sha256(_HEALTH_BODY).hexdigest()[:16]}"',
+    "Cache-Control": "public, max-age=5",
+}
+
+
 @app.get("/api/v1/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
-    return {"status": "healthy", "service": "bash2yaml-api", "version": "1.0.0"}
+    if request.headers.get("if-none-match") == _HEALTH_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_HEALTH_HEADERS)
+    return Response(content=_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
 
 
 @app.post("/api/v1/validate", response_model=ValidationResponse)
@@ -168,7 +617,7 @@ async def validate_config(request: ValidationRequest):
         errors.append(f"Input path is not a directory: {request.inputDir}")
     else:
         # Check for .gitlab-ci.yml files
-        gitlab_files = list(input_path.rglob("*.gitlab-ci.yml")) + list(input_path.rglob(".gitlab-ci.yml"))
+        gitlab_files, _ = _scan_gitlab_and_yaml(input_path)
         if not gitlab_files:
             warnings.append("No .gitlab-ci.yml files found in input directory")
 
@@ -200,9 +649,10 @@ async def validate_config(request: ValidationRequest):
 @app.post("/api/v1/compile", response_model=TaskResponse)
 async def start_compile(config: OperationConfig, background_tasks: BackgroundTasks):
     """Start a compile operation"""
-    task_id = create_task("compile")
+    task_id = await create_task("compile")
 
-    background_tasks.add_task(
+    await start_operation(
+        background_tasks,
         run_compile_operation,
         task_id,
         config.inputDir,
@@ -218,9 +668,9 @@ async def start_compile(config: OperationConfig, background_tasks: BackgroundTas
 @app.post("/api/v1/clean", response_model=TaskResponse)
 async def start_clean(config: OperationConfig, background_tasks: BackgroundTasks):
     """Start a clean operation"""
-    task_id = create_task("clean")
+    task_id = await create_task("clean")
 
-    background_tasks.add_task(run_clean_operation, task_id, config.outputDir, config.dryRun)
+    await start_operation(background_tasks, run_clean_operation, task_id, config.outputDir, config.dryRun)
 
     return TaskResponse(task_id=task_id, message="Clean operation started")
 
@@ -228,9 +678,9 @@ async def start_clean(config: OperationConfig, background_tasks: BackgroundTasks
 @app.post("/api/v1/lint", response_model=TaskResponse)
 async def start_lint(config: OperationConfig, background_tasks: BackgroundTasks):
     """Start a lint operation"""
-    task_id = create_task("lint")
+    task_id = await create_task("lint")
 
-    background_tasks.add_task(run_lint_operation, task_id, config.outputDir, config.verbose)
+    await start_operation(background_tasks, run_lint_operation, task_id, config.outputDir, config.verbose)
 
     return TaskResponse(task_id=task_id, message="Lint operation started")
 
@@ -238,9 +688,11 @@ async def start_lint(config: OperationConfig, background_tasks: BackgroundTasks)
 @app.post("/api/v1/decompile", response_model=TaskResponse)
 async def start_decompile(config: OperationConfig, background_tasks: BackgroundTasks):
     """Start a decompile operation"""
-    task_id = create_task("decompile")
+    task_id = await create_task("decompile")
 
-    background_tasks.add_task(run_decompile_operation, task_id, config.inputDir, config.outputDir, config.dryRun)
+    await start_operation(
+        background_tasks, run_decompile_operation, task_id, config.inputDir, config.outputDir, config.dryRun
+    )
 
     return TaskResponse(task_id=task_id, message="Decompile operation started")
 
@@ -248,24 +700,73 @@ async def start_decompile(config: OperationConfig, background_tasks: BackgroundT
 @app.get("/api/v1/status/{task_id}", response_model=TaskStatus)
 async def get_task_status(task_id: str):
     """Get status of a running task"""
-    if task_id not in tasks:
+    task = await get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    return _status_model(task)
+
+
+@app.get("/api/v1/logs/{task_id}", response_model=TaskLogs)
+async def get_task_log_lines(task_id: str, offset: int = Query(default=0, ge=0)):
+    """Get log lines from ``offset`` on; pass ``next_offset`` back to fetch only newer lines"""
+    found = await get_task_logs(task_id, offset)
+    if found is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    start, lines, next_offset = found
+    return TaskLogs(task_id=task_id, offset=start, messages=lines, next_offset=next_offset)
+
+
+@app.get("/api/v1/status/{task_id}/short", response_model=TaskStatusShort)
+async def get_task_status_short(task_id: str):
+    """Get only status, progress and current step; cheap enough to poll"""
+    task = await get_task_short(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    task = tasks[task_id]
-    return TaskStatus(**task)
+    return TaskStatusShort(**task)
+
+
+@app.websocket("/api/v1/ws/{task_id}")
+async def task_updates(websocket: WebSocket, task_id: str):
+    """Push status changes and log lines for a task as they happen.
+
+    The first frame is the full current status; after that each frame carries only the
+    fields that changed, or a single ``message``. Clients that can't use WebSockets should
+    poll /api/v1/status/{task_id}/short with backoff (1s, then 5s, then 30s) rather than a
+    fixed interval.
+    """
+    await websocket.accept()
+    # Register before reading the snapshot: notify() drops updates for tasks nobody watches,
+    # and get_task is a Redis round trip, so a terminal update could land in that gap.
+    manager.connect(task_id, websocket)
+    try:
+        task = await get_task(task_id)
+        if task is None:
+            await websocket.close(code=4404, reason="Task not found")
+            return
+        await websocket.send_text(_status_model(task).model_dump_json())
+        # Nothing is expected from the client; receiving just notices the disconnect
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        manager.disconnect(task_id, websocket)
 
 
 @app.get("/api/v1/results/{task_id}", response_model=TaskResults)
 async def get_task_results(task_id: str):
     """Get results of a completed task"""
-    if task_id not in tasks:
+    task = await get_task(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    task = tasks[task_id]
-    if task["status"] != "completed":
+    if task.status != "completed":
         raise HTTPException(status_code=400, detail="Task not completed")
 
-    results = task.get("results", {})
+    results = task.results
     return TaskResults(
         task_id=task_id,
         summary=results.get("summary", "Operation completed"),
@@ -278,34 +779,35 @@ async def get_task_results(task_id: str):
 @app.post("/api/v1/cancel/{task_id}")
 async def cancel_task(task_id: str):
     """Cancel a running task"""
-    if task_id not in tasks:
+    task = await get_task(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    task = tasks[task_id]
-    if task["status"] in ["completed", "failed", "cancelled"]:
+    if task.status in FINISHED:
         raise HTTPException(status_code=400, detail="Task already finished")
 
-    update_task(task_id, status="cancelled", error="Cancelled by user")
-    log_task_message(task_id, "Operation cancelled by user")
+    await update_task(task_id, status="cancelled", error="Cancelled by user")
+    await log_task_message(task_id, "Operation cancelled by user")
 
     return {"message": "Task cancelled", "task_id": task_id}
 
 
 @app.get("/api/v1/tasks")
 async def list_tasks():
-    """List all tasks"""
-    return {
-        "tasks": [
-            {
-                "task_id": task_id,
-                "operation": task["operation"],
-                "status": task["status"],
-                "started_at": task["started_at"].isoformat(),
-                "progress": task["progress"],
+    """List all tasks as newline-delimited JSON, one task per line"""
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for task in iter_tasks():
+            record = {
+                "task_id": task.id,
+                "operation": task.operation,
+                "status": task.status,
+                "started_at": task.started_at,
+                "progress": task.progress,
             }
-            for task_id, task in tasks.items()
-        ]
-    }
+            yield orjson.dumps(record) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 # Configuration endpoints
@@ -313,19 +815,28 @@ async def list_tasks():
 async def save_config(config_data: ConfigData):
     """Save configuration"""
     config_id = "default"  # Could be user-specific in the future
-    configs[config_id] = config_data.dict()
+    configs[config_id] = config_data.model_dump()
 
-    # Optionally save to file
+    # Optionally save to file; write a temp file and rename it so a crash can't leave half a file
     try:
         config_file = Path("bash2yaml-web-config.json")
-        with config_file.open("w") as f:
-            json.dump(configs[config_id], f, indent=2)
+        tmp_file = config_file.with_name(f"{config_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(orjson.dumps(configs[config_id], option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, config_file)
     except Exception as e:
         logger.warning(f"Failed to save config to file: {e}")
 
     return {"message": "Configuration saved", "config_id": config_id}
 
 
+@app.post("/api/v1/config/reload")
+async def reload_config():
+    """Re-read bash2yaml's config file and environment for the lint settings (this worker only)"""
+    global _LINT_URL, _LINT_PROJECT
+    _LINT_URL, _LINT_PROJECT = _read_lint_settings(Config())
+    return {"message": "Configuration reloaded", "gitlab_url": _LINT_URL, "project_id": _LINT_PROJECT}
+
+
 @app.get("/api/v1/config", response_model=ConfigData)
 async def load_config():
     """Load configuration"""
@@ -335,9 +846,7 @@ async def load_config():
     try:
         config_file = Path("bash2yaml-web-config.json")
         if config_file.exists():
-            with config_file.open("r") as f:
-                file_config = json.load(f)
-                configs[config_id] = file_config
+            configs[config_id] = orjson.loads(config_file.read_bytes())
     except Exception as e:
         logger.warning(f"Failed to load config from file: {e}")
 
@@ -354,70 +863,131 @@ async def run_compile_operation(
 ):
     """Background task for compile operation"""
     try:
-        update_task(task_id, status="running", progress=10, current_step="Starting compilation")
-        log_task_message(task_id, f"Compiling from {input_dir} to {output_dir}")
+        await update_task(task_id, status="running", progress=10, current_step="Starting compilation")
+        await log_task_message(task_id, f"Compiling from {input_dir} to {output_dir}")
 
         if dry_run:
-            log_task_message(task_id, "DRY RUN MODE - No files will be modified")
+            await log_task_message(task_id, "DRY RUN MODE - No files will be modified")
 
-        update_task(task_id, progress=25, current_step="Processing templates")
+        await update_task(task_id, progress=25, current_step="Processing templates")
 
         # Call your existing compile function
         in_path = Path(input_dir)
         out_path = Path(output_dir)
 
-        # Create a progress callback
-        def progress_callback(current: int, total: int, filename: str):
-            progress = 25 + int((current / total) * 60)  # 25-85%
-            update_task(task_id, progress=progress, current_step=f"Processing {filename} ({current}/{total})")
-            log_task_message(task_id, f"Processing: {filename}")
-
-        # Run the actual compilation
-        files_processed = await asyncio.get_event_loop().run_in_executor(
-            None,
-            lambda: run_compile_all_with_progress(
-                in_path, out_path, dry_run, parallelism, force, task_id, progress_callback
-            ),
-        )
-
-        update_task(task_id, progress=95, current_step="Finalizing output")
-        log_task_message(task_id, f"Compilation completed. {files_processed} files processed.")
+        sync_manager = _get_sync_manager()
+        cancel_event = cancel_events[task_id] = sync_manager.Event()
+        progress_queue = sync_manager.Queue()
+        task = await get_task(task_id)
+        if task is None or task.status == "cancelled":
+            return
+
+        # Run the actual compilation in a worker process; the arguments must be picklable
+        forwarding = asyncio.create_task(_forward_compile_progress(task_id, progress_queue))
+        try:
+            files_processed = await asyncio.get_running_loop().run_in_executor(
+                COMPILE_POOL,
+                functools.partial(
+                    run_compile_all_with_progress,
+                    in_path,
+                    out_path,
+                    dry_run,
+                    parallelism,
+                    force,
+                    cancel_event,
+                    progress_queue,
+                ),
+            )
+        except CompileCancelled:
+            # The cancel endpoint has already recorded the status
+            await log_task_message(task_id, "Compilation stopped")
+            return
+        finally:
+            # Everything the worker reported is queued ahead of this, so the forwarder drains it all
+            progress_queue.put(None)
+            await forwarding
+
+        await update_task(task_id, progress=95, current_step="Finalizing output")
+        await log_task_message(task_id, f"Compilation completed. {files_processed} files processed.")
 
         # Store results
         results = {
             "summary": f"Successfully compiled {files_processed} files",
             "files_processed": files_processed,
-            "output_files": list(out_path.rglob("*.yml")) + list(out_path.rglob("*.yaml")),
+            "output_files": _list_yaml(out_path),
         }
 
-        update_task(task_id, status="completed", progress=100, current_step="Complete", results=results)
+        await update_task(task_id, status="completed", progress=100, current_step="Complete", results=results)
 
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Compile operation failed for task {task_id}: {error_msg}")
-        update_task(task_id, status="failed", error=error_msg)
-        log_task_message(task_id, f"ERROR: {error_msg}")
+        await update_task(task_id, status="failed", error=error_msg)
+        await log_task_message(task_id, f"ERROR: {error_msg}")
+    finally:
+        cancel_events.pop(task_id, None)
+
+
+async def _forward_compile_progress(task_id: str, progress_queue: Any) -> None:
+    """Apply progress batches sent by a compile worker until the None sentinel arrives."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = await loop.run_in_executor(None, progress_queue.get)
+        if batch is None:
+            return
+        current, total, filename, lines = batch
+        progress = 25 + int((current / total) * 60)  # 25-85%
+        await update_task(task_id, progress=progress, current_step=f"Processing {filename} ({current}/{total})")
+        await log_task_message(task_id, *lines)
 
 
 def run_compile_all_with_progress(
-    input_path: Path, output_path: Path, dry_run: bool, parallelism: int, force: bool, task_id: str, progress_callback
+    input_path: Path,
+    output_path: Path,
+    dry_run: bool,
+    parallelism: int,
+    force: bool,
+    cancel_event: Any,
+    progress_queue: Any,
 ):
-    """Wrapper for compile_all with progress reporting"""
+    """Wrapper for compile_all that reports how many files it processed; runs in COMPILE_POOL"""
+    last_emit = 0.0
+    pending: list[str] = []
+
+    def progress_callback(current: int, total: int, source: Path) -> None:
+        nonlocal last_emit
+        # Checked after every file, so a cancel takes effect mid-run instead of being ignored
+        if cancel_event.is_set():
+            raise CompileCancelled()
+        pending.append(f"Processing: {source.name}")
+        # Each report crosses to the manager process and then the event loop, so send at most one
+        # per PROGRESS_INTERVAL (plus the last file) with the log lines collected since the previous one
+        now = time.monotonic()
+        if now - last_emit < PROGRESS_INTERVAL and current != total:
+            return
+        last_emit = now
+        progress_queue.put((current, total, source.name, pending[:]))
+        pending.clear()
+
     try:
         # Get list of files to process
-        yaml_files = list(input_path.rglob("*.yml")) + list(input_path.rglob("*.yaml"))
+        _, yaml_files = _scan_gitlab_and_yaml(input_path)
         total_files = len(yaml_files)
 
-        if tasks[task_id]["status"] == "cancelled":
-            return 0
-
         # Call the actual function
         run_compile_all(
-            uncompiled_path=input_path, output_path=output_path, dry_run=dry_run, parallelism=parallelism, force=force
+            input_dir=input_path,
+            output_path=output_path,
+            dry_run=dry_run,
+            parallelism=parallelism,
+            force=force,
+            progress_callback=progress_callback,
         )
 
         return total_files
 
+    except CompileCancelled:
+        raise
     except Exception as e:
         logger.error(f"Compile execution failed: {e}")
         raise
@@ -426,47 +996,47 @@ def run_compile_all_with_progress(
 async def run_clean_operation(task_id: str, output_dir: str, dry_run: bool):
     """Background task for clean operation"""
     try:
-        update_task(task_id, status="running", progress=20, current_step="Scanning output directory")
-        log_task_message(task_id, f"Cleaning directory: {output_dir}")
+        await update_task(task_id, status="running", progress=20, current_step="Scanning output directory")
+        await log_task_message(task_id, f"Cleaning directory: {output_dir}")
 
         if dry_run:
-            log_task_message(task_id, "DRY RUN MODE - No files will be deleted")
+            await log_task_message(task_id, "DRY RUN MODE - No files will be deleted")
 
-        update_task(task_id, progress=50, current_step="Identifying files to clean")
+        await update_task(task_id, progress=50, current_step="Identifying files to clean")
 
         # Run the actual clean operation
         out_path = Path(output_dir)
         await asyncio.get_event_loop().run_in_executor(None, lambda: clean_targets(out_path, dry_run=dry_run))
 
-        update_task(task_id, progress=90, current_step="Finalizing cleanup")
-        log_task_message(task_id, "Clean operation completed")
+        await update_task(task_id, progress=90, current_step="Finalizing cleanup")
+        await log_task_message(task_id, "Clean operation completed")
 
         results = {
             "summary": f"Clean operation completed on {output_dir}",
         }
 
-        update_task(task_id, status="completed", progress=100, current_step="Complete", results=results)
+        await update_task(task_id, status="completed", progress=100, current_step="Complete", results=results)
 
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Clean operation failed for task {task_id}: {error_msg}")
-        update_task(task_id, status="failed", error=error_msg)
-        log_task_message(task_id, f"ERROR: {error_msg}")
+        await update_task(task_id, status="failed", error=error_msg)
+        await log_task_message(task_id, f"ERROR: {error_msg}")
 
 
 async def run_lint_operation(task_id: str, output_dir: str, verbose: bool):
     """Background task for lint operation"""
     try:
-        update_task(task_id, status="running", progress=15, current_step="Connecting to GitLab API")
-        log_task_message(task_id, f"Linting files in: {output_dir}")
+        await update_task(task_id, status="running", progress=15, current_step="Connecting to GitLab API")
+        await log_task_message(task_id, f"Linting files in: {output_dir}")
 
-        update_task(task_id, progress=30, current_step="Scanning YAML files")
+        await update_task(task_id, progress=30, current_step="Scanning YAML files")
 
-        # Get GitLab connection info from config
-        gitlab_url = config.lint_gitlab_url or "https://gitlab.com"
-        project_id = config.lint_project_id
+        # GitLab connection info, read from config at startup
+        gitlab_url = _LINT_URL
+        project_id = _LINT_PROJECT
 
-        update_task(task_id, progress=50, current_step="Running GitLab CI Lint")
+        await update_task(task_id, progress=50, current_step="Running GitLab CI Lint")
 
         # Run the actual lint operation
         out_path = Path(output_dir)
@@ -482,12 +1052,12 @@ async def run_lint_operation(task_id: str, output_dir: str, verbose: bool):
             ),
         )
 
-        update_task(task_id, progress=80, current_step="Analyzing results")
+        await update_task(task_id, progress=80, current_step="Analyzing results")
 
         # Summarize results
         ok_count, fail_count = summarize_results(results)
 
-        log_task_message(task_id, f"Lint completed: {ok_count} valid, {fail_count} invalid files")
+        await log_task_message(task_id, f"Lint completed: {ok_count} valid, {fail_count} invalid files")
 
         summary = f"Linting completed: {ok_count} valid files, {fail_count} files with issues"
 
@@ -497,67 +1067,97 @@ async def run_lint_operation(task_id: str, output_dir: str, verbose: bool):
             "warnings": [f"{fail_count} files had validation issues"] if fail_count > 0 else None,
         }
 
-        update_task(task_id, status="completed", progress=100, current_step="Complete", results=task_results)
+        await update_task(task_id, status="completed", progress=100, current_step="Complete", results=task_results)
 
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Lint operation failed for task {task_id}: {error_msg}")
-        update_task(task_id, status="failed", error=error_msg)
-        log_task_message(task_id, f"ERROR: {error_msg}")
+        await update_task(task_id, status="failed", error=error_msg)
+        await log_task_message(task_id, f"ERROR: {error_msg}")
 
 
 async def run_decompile_operation(task_id: str, input_dir: str, output_dir: str, dry_run: bool):
     """Background task for decompile operation"""
     try:
-        update_task(task_id, status="running", progress=20, current_step="Starting decompile")
-        log_task_message(task_id, f"Decompiling from {input_dir} to {output_dir}")
+        await update_task(task_id, status="running", progress=20, current_step="Starting decompile")
+        await log_task_message(task_id, f"Decompiling from {input_dir} to {output_dir}")
 
         if dry_run:
-            log_task_message(task_id, "DRY RUN MODE - No files will be modified")
+            await log_task_message(task_id, "DRY RUN MODE - No files will be modified")
 
-        update_task(task_id, progress=40, current_step="Processing YAML files")
+        await update_task(task_id, progress=40, current_step="Processing YAML files")
 
         # Run the actual decompile operation
         in_path = Path(input_dir)
         out_path = Path(output_dir)
 
-        yml_count, jobs, scripts = await asyncio.get_event_loop().run_in_executor(
-            None, lambda: run_decompile_gitlab_tree(input_root=in_path, output_dir=out_path, dry_run=dry_run)
+        yml_count, jobs, scripts = await asyncio.get_running_loop().run_in_executor(
+            COMPILE_POOL,
+            functools.partial(run_decompile_gitlab_tree, input_root=in_path, output_dir=out_path, dry_run=dry_run),
         )
 
-        update_task(task_id, progress=90, current_step="Finalizing decompilation")
+        await update_task(task_id, progress=90, current_step="Finalizing decompilation")
 
-        log_task_message(task_id, f"Decompiled {yml_count} YAML files, {jobs} jobs, created {scripts} scripts")
+        await log_task_message(task_id, f"Decompiled {yml_count} YAML files, {jobs} jobs, created {scripts} scripts")
 
         results = {
             "summary": f"Decompiled {yml_count} YAML files, processed {jobs} jobs, created {scripts} script files",
             "files_processed": yml_count,
         }
 
-        update_task(task_id, status="completed", progress=100, current_step="Complete", results=results)
+        await update_task(task_id, status="completed", progress=100, current_step="Complete", results=results)
 
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Decompile operation failed for task {task_id}: {error_msg}")
-        update_task(task_id, status="failed", error=error_msg)
-        log_task_message(task_id, f"ERROR: {error_msg}")
+        await update_task(task_id, status="failed", error=error_msg)
+        await log_task_message(task_id, f"ERROR: {error_msg}")
 
 
-# Cleanup old tasks (in production, use a proper job queue)
+# Old tasks need no sweep here: Redis keys expire after TASK_TTL, and the in-process
+# store drops its oldest task once it holds MAX_LOCAL_TASKS.
 @app.on_event("startup")
 async def startup_event():
-    """Cleanup tasks on startup"""
+    """Log startup"""
     logger.info("bash2yaml API server starting up")
-
-    # Clean up old task data (keep last 100 tasks)
-    def cleanup_old_tasks():
-        if len(tasks) > 100:
-            # Keep only the 100 most recent tasks
-            sorted_tasks = sorted(tasks.items(), key=lambda x: x[1]["started_at"], reverse=True)
-            tasks.clear()
-            tasks.update(dict(sorted_tasks[:100]))
-
-    cleanup_old_tasks()
+    redis = get_redis()
+    if redis is not None:
+        logger.info("Task state is stored in Redis")
+        app.state.relay = asyncio.create_task(relay_task_events(redis))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the compile pool and cancel-flag manager, and close this worker's Redis connection pool"""
+    COMPILE_POOL.shutdown(wait=False, cancel_futures=True)
+    if _sync_manager is not None:
+        _sync_manager.shutdown()
+    relay = getattr(app.state, "relay", None)
+    if relay is not None:
+        relay.cancel()
+    if _arq_pool is not None:
+        await _arq_pool.aclose()
+    if _redis is not None:
+        await _redis.aclose()
+
+
+def uvicorn_performance_options(reload: bool) -> dict[str, Any]:
+    """uvicorn.run options for the C event loop and HTTP parser, plus one worker per core when safe.
+
+    uvloop and httptools ship with ``uvicorn[standard]``; uvloop has no Windows build. Extra
+    workers only share task state through Redis, and uvicorn can't combine them with reload.
+    The worker count is exported as ``BASH2YAML_WEB_WORKERS`` so each worker sizes its
+    COMPILE_POOL to its share of the cores instead of all of them.
+    """
+    workers = os.cpu_count() if REDIS_URL and not reload else None
+    if workers and workers > 1:
+        # Inherited by the worker processes uvicorn spawns, which read it on import
+        os.environ["BASH2YAML_WEB_WORKERS"] = str(workers)
+    return {
+        "loop": "asyncio" if sys.platform == "win32" else "uvloop",
+        "http": "httptools",
+        "workers": workers,
+    }
 
 
 if __name__ == "__main__":
@@ -586,4 +1186,5 @@ if __name__ == "__main__":
         port=args.port,
         reload=args.reload,
         log_level="info",
+        **uvicorn_performance_options(args.reload),
     )
@@ -40,6 +40,9 @@ def main():
             port=8000,
             reload=True,  # Enable auto-reload for development
             log_level="info",
+            # C event loop (not on Windows) and HTTP parser, both installed by uvicorn[standard]
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
         )
     except KeyboardInterrupt:
         print("\n✅ API server stopped")
@@ -4,7 +4,6 @@ Convenience script to serve the web interface
 """
 
 import http.server
-import socketserver
 import webbrowser
 from pathlib import Path
 
@@ -24,13 +23,20 @@ def main():
             self.send_header("Access-Control-Allow-Headers", "Content-Type")
             super().end_headers()
 
+        def copyfile(self, source, outputfile):
+            # Let the kernel copy the file to the socket (os.sendfile where available; socket.sendfile
+            # falls back to plain sends elsewhere) instead of shuttling it through a userspace buffer.
+            # The headers were written unbuffered, so nothing is pending on outputfile.
+            self.connection.sendfile(source)
+
     print(f"🌐 Starting web interface server at http://localhost:{PORT}")
     print("   Make sure the API server is running at http://localhost:8000")
     print("   Press Ctrl+C to stop")
     print()
 
     try:
-        with socketserver.TCPServer(("", PORT), Handler) as httpd:
+        # One thread per request, so the page's HTML, scripts and icons load in parallel
+        with http.server.ThreadingHTTPServer(("", PORT), Handler) as httpd:
             # Open browser automatically
             webbrowser.open(f"http://localhost:{PORT}")
             httpd.serve_forever()
@@ -0,0 +1,57 @@
+"""
+arq worker for the bash2yaml API server
+Runs compile/clean/lint/decompile jobs queued by main.py when BASH2YAML_JOB_QUEUE=arq
+
+Start it next to the API with the same BASH2YAML_REDIS_URL:
+    arq workers.WorkerSettings
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any
+
+from arq.connections import RedisSettings
+
+import main
+
+
+# Job names match the operation functions in main.py, which is how start_operation enqueues them
+async def run_compile_operation(ctx: dict[str, Any], *args: Any) -> None:
+    await main.run_compile_operation(*args)
+
+
+async def run_clean_operation(ctx: dict[str, Any], *args: Any) -> None:
+    await main.run_clean_operation(*args)
+
+
+async def run_lint_operation(ctx: dict[str, Any], *args: Any) -> None:
+    await main.run_lint_operation(*args)
+
+
+async def run_decompile_operation(ctx: dict[str, Any], *args: Any) -> None:
+    await main.run_decompile_operation(*args)
+
+
+async def startup(ctx: dict[str, Any]) -> None:
+    """Listen for task events so cancel requests reach compiles running here"""
+    redis = main.get_redis()
+    if redis is not None:
+        ctx["relay"] = asyncio.create_task(main.relay_task_events(redis))
+
+
+async def shutdown(ctx: dict[str, Any]) -> None:
+    relay = ctx.get("relay")
+    if relay is not None:
+        relay.cancel()
+    await main.shutdown_event()
+
+
+class WorkerSettings:
+    functions = [run_compile_operation, run_clean_operation, run_lint_operation, run_decompile_operation]
+    redis_settings = RedisSettings.from_dsn(os.environ.get("BASH2YAML_REDIS_URL", "redis://localhost:6379"))
+    on_startup = startup
+    on_shutdown = shutdown
+    # Compiles can take a while on large trees; arq's default is 300s
+    job_timeout = 3600
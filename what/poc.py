@@ -1,6 +1,43 @@
+from functools import lru_cache
 from pathlib import Path
 
 from ruamel.yaml import YAML
+from ruamel.yaml.constructor import SafeConstructor
+
+
+@lru_cache(maxsize=128)
+def _read(path: str, mtime_ns: int) -> str:
+    """Read an included file; the mtime in the key makes an edited file miss the cache."""
+    return Path(path).read_text()
+
+
+# --- Define the custom constructor function ---
+# This function tells the parser what to do when it sees "!include"
+def include_constructor(loader, node):
+    """
+    Reads the content of the file specified in the node.
+    The value of the node is the filename (e.g., 'my_script.sh').
+    """
+    file_path = Path(node.value)
+    if not file_path.is_file():
+        # You could raise an error or handle it as needed
+        return f"ERROR: File not found at {file_path}"
+    return _read(str(file_path), file_path.stat().st_mtime_ns)
+
+
+class _IncludeConstructor(SafeConstructor):
+    """SafeConstructor plus !include; a subclass so the tag isn't added to every safe loader."""
+
+
+# Teach the parser about our new "!include" tag
+_IncludeConstructor.add_constructor("!include", include_constructor)
+
+# --- Initialize the parser once ---
+# Building YAML() sets up the scanner/resolver tables, so reuse one instance across loads.
+# Flattening includes needs no comments or formatting, so use the safe loader on the
+# libyaml C parser rather than the much slower pure-Python round-trip loader.
+_YAML = YAML(typ="safe", pure=False)
+_YAML.Constructor = _IncludeConstructor
 
 
 def run() -> None:
@@ -20,29 +57,11 @@ def run() -> None:
         - echo "This is another command."
     """
 
-    # --- 3. Define the custom constructor function ---
-    # This function tells the parser what to do when it sees "!include"
-    def include_constructor(loader, node):
-        """
-        Reads the content of the file specified in the node.
-        The value of the node is the filename (e.g., 'my_script.sh').
-        """
-        file_path = Path(node.value)
-        if not file_path.is_file():
-            # You could raise an error or handle it as needed
-            return f"ERROR: File not found at {file_path}"
-        return file_path.read_text()
-
-    # --- 4. Initialize the parser and register the custom tag ---
-    yaml = YAML()
-    # Teach the parser about our new "!include" tag
-    yaml.constructor.add_constructor("!include", include_constructor)
-
     print("--- Source YAML ---")
     print(yaml_string)
 
-    # --- 5. Load the YAML and see the result ---
-    data = yaml.load(yaml_string)
+    # --- 3. Load the YAML and see the result ---
+    data = _YAML.load(yaml_string)
 
     print("\n--- Parsed Python Object (YAML structure) ---")
     print(data)
@@ -51,7 +70,7 @@ def run() -> None:
     for command in data["job"]["script"]:
         print(f"- {command.strip()}")
 
-    # --- 6. Clean up the dummy file ---
+    # --- 4. Clean up the dummy file ---
     script_path.unlink()
     print(f"\nCleaned up (deleted) '{script_path}'")
 
@@ -0,0 +1,67 @@
+import os
+import shutil
+
+import pytest
+
+import variables_support as vs
+
+pytestmark = pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+
+
+def _via_bash(path):
+    return vs._run_sh_batch([str(path)])[str(path)]
+
+
+def _via_static(path):
+    st = os.stat(path)
+    return vs._parse_static_sh(str(path), st.st_mtime_ns, st.st_size)
+
+
+def test_static_and_bash_paths_agree_on_the_same_file(tmp_path):
+    path = tmp_path / "job.variables.sh"
+    path.write_text(
+        "# settings\nexport LANG=C\nexport LC_ALL=C\nPATH=/usr/bin:/bin\nZ='two words'  # note\nEMPTY=\n",
+        encoding="utf-8",
+    )
+
+    static = _via_static(path)
+
+    # Behavior: literal-only file takes the static path, and bash reports exactly the same
+    assert static == {"LANG": "C", "LC_ALL": "C", "PATH": "/usr/bin:/bin", "Z": "two words", "EMPTY": ""}
+    assert _via_bash(path) == static
+
+
+def test_injected_env_names_survive_when_the_file_exports_them(tmp_path):
+    literal = tmp_path / "a.variables.sh"
+    literal.write_text("export LANG=C\nZ=2\n", encoding="utf-8")
+    dynamic = tmp_path / "b.variables.sh"
+    dynamic.write_text("export LANG=C\nZ=$(echo 2)\n", encoding="utf-8")
+
+    result = vs._collect_exported_env_batch([literal, dynamic])
+
+    # Behavior: one `$` in the file must not change which variables come back
+    assert result[literal] == result[dynamic] == {"LANG": "C", "Z": "2"}
+
+
+def test_bash_path_reports_only_what_the_file_exports(tmp_path):
+    path = tmp_path / "job.variables.sh"
+    path.write_text('STAMP=$(printf x | wc -c)\ncd "$(dirname "$0")"\n', encoding="utf-8")
+
+    # Behavior: PATH/locale we start bash with and bash's own PWD/OLDPWD/SHLVL/_ never leak
+    assert _via_static(path) is None
+    assert _via_bash(path) == {"STAMP": "1"}
+
+
+def test_dynamic_files_are_re_run_on_every_call(tmp_path):
+    common = tmp_path / "common.sh"
+    common.write_text("REV=one\n", encoding="utf-8")
+    path = tmp_path / "job.variables.sh"
+    path.write_text(f". {common}\n", encoding="utf-8")
+    before = os.stat(path)
+
+    assert vs._load_vars_file(path) == {"REV": "one"}
+    common.write_text("REV=two\n", encoding="utf-8")
+
+    # Behavior: the file itself is untouched, but what it sources changed; no stale result
+    assert os.stat(path).st_mtime_ns == before.st_mtime_ns
+    assert vs._load_vars_file(path) == {"REV": "two"}
@@ -32,80 +32,237 @@ Integrations:
 - Wire CLI subcommands via `add_cli_subcommands(subparsers)`.
 
 Notes:
-- For `.sh` vars files we launch a bash subshell with a controlled, empty env, source the file with `set -a`, and then capture the diff of `env -0`.
+- For `.sh` vars files we launch a bash subshell with a minimal env (PATH and the C locale only), source the file with `set -a`, and then capture what `env -0` lists besides bash's own PWD/OLDPWD/SHLVL/_.
+  Files that are only literal `KEY=value` lines are read directly, without starting bash.
 - We never attempt to materialize UI/group/project protected/masked variables.
 - We never evaluate arbitrary code at compile-time except in the explicit `.variables.sh` files the user created for this purpose.
 """
 
 from __future__ import annotations
 
+import copy
 import json
+import os
 import re
 import shlex
 import subprocess
-from collections.abc import Iterable
+import tempfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby, repeat
 from pathlib import Path
-from typing import dict
-
-from ruamel.yaml import CommentedMap
-from ruamel.yaml.scalarstring import DoubleQuotedScalarString
+from typing import TYPE_CHECKING, Any
 
 from bash2yaml.utils.dotenv import parse_env_file  # type: ignore
 
-SAFE_KEY_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+if TYPE_CHECKING:
+    from ruamel.yaml import CommentedMap
+
+# ASCII \w is exactly [A-Za-z0-9_]; \Z (unlike $) rejects a trailing newline
+SAFE_KEY_RE = re.compile(r"[A-Za-z_]\w*\Z", re.ASCII)
+SAFE_KEY_BYTES_RE = re.compile(rb"[A-Za-z_]\w*\Z")
+_READ_SIZE = 65536
+# The whole environment `.variables.sh` files are sourced in: a fixed PATH for standard
+# utilities and a predictable locale. Anything else must be exported by the file itself.
+_BASH_ENV = {"PATH": "/usr/bin:/bin", "LC_ALL": "C", "LANG": "C"}
+# Run in each subshell before sourcing: the names stay usable as shell variables but drop out
+# of `env -0`, so they only show up if the file exports them (under `set -a`, any assignment does).
+_UNEXPORT_BASH_ENV = "export -n " + " ".join(_BASH_ENV)
+# Variables bash exports on its own in every subshell; never the file's, so both the bash
+# and the static path drop them by name.
+_BASH_OWN_VARS = frozenset(("PWD", "OLDPWD", "SHLVL", "_"))
+# One `.variables.sh` line bash would treat as a plain literal assignment: optional export,
+# then an unquoted word free of expansions/metacharacters, or a quoted string free of
+# expansions and escapes, then an optional comment (which needs a blank before it).
+_STATIC_SH_LINE_RE = re.compile(
+    r"""[ \t]*(?:export[ \t]+)?([A-Za-z_]\w*)=([^ \t$`"'\\;&|<>()~]*|"[^"$`\\]*"|'[^']*')(?:[ \t]+(?:\#.*)?)?""",
+    re.ASCII,
+)
+
+
+_JOB_NAME_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_]")
+# str.translate table indexed by code point: ASCII alnum and '_' map to themselves, the rest to '_'
+_JOB_NAME_TABLE = "".join(ch if ch.isalnum() or ch == "_" else "_" for ch in map(chr, range(128)))
 
 
 def _normalize_job_name(name: str) -> str:
-    return re.sub(r"[^A-Za-z0-9_]", "_", name)
+    if name.isascii():
+        return name.translate(_JOB_NAME_TABLE)
+    return _JOB_NAME_UNSAFE_RE.sub("_", name)
 
 
 def _collect_exported_env_from_sh(path: Path) -> dict[str, str]:
     """Source a .sh in a clean bash subshell and capture exported env as a dict.
 
-    We deliberately use an *empty* environment so the file must set each var it wants
-    exported. Functions/aliases are ignored because we only read `env`.
+    We deliberately start from a near-empty environment (just `_BASH_ENV`) so the file
+    must set each var it wants exported; PATH is there only so the file can call standard
+    utilities. Functions/aliases are ignored because we only read `env`.
     """
-    if not path.exists():
-        return {}
+    return _collect_exported_env_batch([path]).get(path, {})
 
-    # Use `set -a` so simple assignments export automatically
-    script = f"set -a\n. {shlex.quote(str(path))}\nset +a\nenv -0"
-
-    # Empty base env; ensure predictable locale
-    proc = subprocess.run(  # noqa
-        ["bash", "-c", script],
-        check=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        env={},
-        text=False,
-    )
-    raw = proc.stdout.split(b"\x00")
+
+def _iter_bash_env0(script: str) -> Iterator[bytes]:
+    """Run `bash -c script` with `_BASH_ENV` and yield its stdout split on NUL as it arrives.
+
+    Only one read's worth of output is held at a time, rather than all of it plus the
+    split copy. stderr goes to a temp file, not a pipe, so a chatty script can't fill
+    the pipe and deadlock against our stdout reads; it's attached to the error if bash fails.
+    """
+    args = ["bash", "-c", script]
+    with tempfile.TemporaryFile() as err:
+        with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=err, env=_BASH_ENV) as proc:  # noqa
+            assert proc.stdout is not None  # nosec
+            pending = b""
+            while chunk := proc.stdout.read(_READ_SIZE):
+                *complete, pending = (pending + chunk).split(b"\x00")
+                yield from complete
+            if pending:
+                yield pending
+            if proc.wait():
+                err.seek(0)
+                raise subprocess.CalledProcessError(proc.returncode, args, stderr=err.read())
+
+
+def _env_from_chunks(raw: Iterable[bytes]) -> dict[str, str]:
+    """Turn NUL-split `env -0` output into a dict, keeping only safe keys."""
     out: dict[str, str] = {}
+    is_safe = SAFE_KEY_BYTES_RE.match
     for chunk in raw:
-        if not chunk:
+        k, sep, v = chunk.partition(b"=")
+        # Validate the key as bytes so rejects are never decoded; safe keys are ASCII
+        if sep and is_safe(k):
+            out[k.decode("ascii")] = v.decode("utf-8", "replace")
+    for k in _BASH_OWN_VARS.intersection(out):
+        del out[k]
+    return out
+
+
+def _run_sh_batch(path_strs: list[str]) -> dict[str, dict[str, str]]:
+    """Source every file in one bash process; each runs in its own subshell so exports don't leak.
+
+    `_BASH_ENV` is un-exported in every subshell, so `env -0` lists only what the file
+    exported plus bash's own `_BASH_OWN_VARS`, which `_env_from_chunks` drops.
+
+    Never cached: a file can source other files or run commands (`$(git rev-parse HEAD)`,
+    `$(date)`), so its own mtime says nothing about whether the result is still current.
+    """
+    parts = []
+    for i, path_str in enumerate(path_strs):
+        # \x01<index>\x00 marks where the next file's `env -0` output starts
+        parts.append(f"printf '\\001%d\\000' {i}")
+        parts.append(f"( {_UNEXPORT_BASH_ENV}; set -a; . {shlex.quote(path_str)}; set +a; env -0 ) || exit $?")
+    current = -1
+
+    def _owner(chunk: bytes) -> int:
+        nonlocal current
+        if chunk[:1] == b"\x01":
+            current = int(chunk[1:])
+        return current
+
+    # Parse each file's run of chunks as it streams past; the marker chunk has no '=' and is skipped
+    envs: list[dict[str, str]] = [{} for _ in path_strs]
+    for index, chunks in groupby(_iter_bash_env0("\n".join(parts)), key=_owner):
+        if index >= 0:
+            envs[index] = _env_from_chunks(chunks)
+    return dict(zip(path_strs, envs))
+
+
+@lru_cache(maxsize=256)
+def _parse_static_sh(path_str: str, mtime_ns: int, size: int) -> dict[str, str] | None:
+    """Read a .variables.sh made only of literal assignments without starting bash.
+
+    Returns None as soon as a line needs the shell: expansions, escapes, command
+    separators, control flow, or anything else `_STATIC_SH_LINE_RE` doesn't cover.
+    """
+    try:
+        text = Path(path_str).read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        return None
+    if "\r" in text:
+        # bash keeps a CR as part of the value; leave CRLF files to bash
+        return None
+    out: dict[str, str] = {}
+    match = _STATIC_SH_LINE_RE.fullmatch
+    for line in text.split("\n"):
+        stripped = line.strip(" \t")
+        if not stripped or stripped[0] == "#":
             continue
+        m = match(line)
+        if m is None:
+            return None
+        key, value = m.groups()
+        if key not in _BASH_OWN_VARS:
+            out[key] = value[1:-1] if value[:1] in ("'", '"') else value
+    return out
+
+
+def _collect_exported_env_batch(paths: Iterable[Path]) -> dict[Path, dict[str, str]]:
+    """Like `_collect_exported_env_from_sh` for many files, with at most a single bash fork.
+
+    Files that are plain `KEY=value` lists are parsed directly (and cached, being
+    deterministic) and never reach bash; the rest are re-run on every call.
+    """
+    result: dict[Path, dict[str, str]] = {}
+    needs_bash: list[Path] = []
+    for path in dict.fromkeys(paths):
         try:
-            s = chunk.decode("utf-8", "replace")
-        except Exception:
+            st = os.stat(path)
+        except FileNotFoundError:
             continue
-        if "=" not in s:
-            continue
-        k, v = s.split("=", 1)
-        if SAFE_KEY_RE.match(k):
-            out[k] = v
-    return out
+        static = _parse_static_sh(str(path), st.st_mtime_ns, st.st_size)
+        if static is not None:
+            result[path] = static
+        else:
+            needs_bash.append(path)
+    if needs_bash:
+        envs = _run_sh_batch([str(path) for path in needs_bash])
+        for path in needs_bash:
+            result[path] = envs[str(path)]
+    return result
+
+
+@lru_cache(maxsize=256)
+def _parse_env_file_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Parse a .env file; mtime and size in the key make an edited file miss the cache."""
+    return parse_env_file(Path(path_str).read_text(encoding="utf-8"))
 
 
 def _load_vars_file(path: Path) -> dict[str, str]:
-    if not path.exists():
-        return {}
-    if path.suffix == ".env":
-        return parse_env_file(path.read_text(encoding="utf-8"))
+    """Return the parse of a vars file, possibly a shared cache entry: merge it, never mutate it."""
     if path.suffix == ".sh":
+        # Only literal-only .sh files are cached (inside the batch helper); the rest run fresh
         return _collect_exported_env_from_sh(path)
-    return {}
+    if path.suffix != ".env":
+        return {}
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return {}
+    return _parse_env_file_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def _dir_entries(path: Path) -> set[str]:
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _load_candidate(path: Path, sh_envs: dict[Path, dict[str, str]]) -> dict[str, str]:
+    if path.suffix == ".sh":
+        return sh_envs.get(path, {})
+    return _load_vars_file(path)
+
+
+def _discover_one_job(candidates: list[Path], sh_envs: dict[Path, dict[str, str]]) -> dict[str, str]:
+    # The only copy made: sources are shared cache entries and are merged, not mutated
+    merged: dict[str, str] = {}
+    for path in candidates:
+        merged.update(_load_candidate(path, sh_envs))
+    return merged
 
 
 @dataclass
@@ -118,46 +275,78 @@ def discover_variables_files(uncompiled_yaml: Path, job_names: Iterable[str]) ->
     stem = uncompiled_yaml.with_suffix("")
     base_dir = uncompiled_yaml.parent
 
-    file_level: dict[str, str] = {}
-    # File-level candidates (ordered)
-    for suffix in (".variables.env", ".variables.sh"):
-        file_level |= _load_vars_file(Path(str(stem) + suffix))
-
-    job_level: dict[str, dict[str, str]] = {}
     vars_dir = base_dir / "vars"
-
+    # One directory listing each instead of a stat per candidate; most candidates don't exist
+    present_base = _dir_entries(base_dir)
+    roots = ((vars_dir, _dir_entries(vars_dir)), (base_dir, present_base))
+
+    # File-level candidates (ordered), then per job: vars/ then next to YAML
+    file_candidates = [
+        base_dir / name
+        for suffix in (".variables.env", ".variables.sh")
+        if (name := stem.name + suffix) in present_base
+    ]
+    job_candidates: dict[str, list[Path]] = {}
     for job in job_names:
         jnorm = _normalize_job_name(job)
-        merged: dict[str, str] = {}
-        # Look in vars/ then next to YAML
-        for root in (vars_dir, base_dir):
-            for suffix in (".variables.env", ".variables.sh"):
-                merged |= _load_vars_file(root / f"{jnorm}{suffix}")
-        job_level[job] = merged
-
-    # validate keys
-    def _validate(d: dict[str, str]) -> dict[str, str]:
-        clean: dict[str, str] = {}
-        for k, v in d.items():
-            if SAFE_KEY_RE.match(k):
-                clean[k] = v
-        return clean
-
-    file_level = _validate(file_level)
-    for j in list(job_level.keys()):
-        job_level[j] = _validate(job_level[j])
+        job_candidates[job] = [
+            root / name
+            for root, present in roots
+            for suffix in (".variables.env", ".variables.sh")
+            if (name := f"{jnorm}{suffix}") in present
+        ]
+
+    # Source all .sh files in one bash process instead of one per file
+    sh_envs = _collect_exported_env_batch(
+        p for p in (*file_candidates, *(p for ps in job_candidates.values() for p in ps)) if p.suffix == ".sh"
+    )
 
+    file_level = _discover_one_job(file_candidates, sh_envs)
+
+    # Per-job work is now stat + .env parse; threads overlap the syscalls (lru_cache is thread-safe)
+    if len(job_candidates) <= 2:
+        job_level = {job: _discover_one_job(paths, sh_envs) for job, paths in job_candidates.items()}
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as executor:
+            merged_vars = executor.map(_discover_one_job, job_candidates.values(), repeat(sh_envs))
+            job_level = dict(zip(job_candidates, merged_vars))
+
+    # No separate key validation pass: parse_env_file only accepts [A-Za-z_][A-Za-z0-9_]* keys
+    # and _env_from_chunks filters .sh output through SAFE_KEY_BYTES_RE, the same rule as SAFE_KEY_RE
     return VariablesBundle(file_level=file_level, job_level=job_level)
 
 
+def _update_as_str(out: dict[str, str], mapping) -> None:
+    """Copy a YAML mapping into `out` as str -> str without building an intermediate dict.
+
+    Plain str keys/values (the common case for ruamel) skip the str() call.
+    """
+    for k, v in mapping.items():
+        out[k if type(k) is str else str(k)] = v if type(v) is str else str(v)
+
+
 def _yaml_map_from(d: dict[str, str]) -> CommentedMap:
-    # Quote to avoid YAML edge cases (e.g., leading zeros, true/false, colon)
+    # Quote to avoid YAML edge cases (e.g., leading zeros, true/false, colon).
+    # Plain item assignment on purpose: CommentedMap(iterable) still inserts key by key and
+    # measured slower; the per-key cost is DoubleQuotedScalarString construction itself.
+    from ruamel.yaml import CommentedMap  # lazy: discover_variables_files alone never needs ruamel
+    from ruamel.yaml.scalarstring import DoubleQuotedScalarString as quoted
+
     m = CommentedMap()
     for k, v in d.items():
-        m[k] = DoubleQuotedScalarString(str(v))
+        m[k] = quoted(v)
     return m
 
 
+# Heuristic: a node is a job (or an extends/template) if it has script-ish keys
+_JOB_KEYS = frozenset(("script", "before_script", "after_script", "pre_get_sources_script"))
+
+
+def _walk_top_level(data) -> list[tuple[Any, dict, bool]]:
+    """One pass over the top-level mapping: (key, node, is_job) for every dict node."""
+    return [(key, node, not _JOB_KEYS.isdisjoint(node)) for key, node in data.items() if isinstance(node, dict)]
+
+
 def merge_into_yaml(data, file_vars: dict[str, str], job_vars: dict[str, dict[str, str]]) -> None:
     """Merge discovered variables into a ruamel data tree.
 
@@ -165,51 +354,57 @@ def merge_into_yaml(data, file_vars: dict[str, str], job_vars: dict[str, dict[st
     - File-level goes into top-level `variables:`
     - Job-level goes into each job's `variables:`
     """
+    _merge_into_yaml_prewalked(data, _walk_top_level(data), file_vars, job_vars)
+
+
+def _merge_into_yaml_prewalked(
+    data, walked: list[tuple[Any, dict, bool]], file_vars: dict[str, str], job_vars: dict[str, dict[str, str]]
+) -> None:
     # Top-level
     if file_vars:
         existing = data.get("variables")
         merged: dict[str, str] = dict(file_vars)
         if isinstance(existing, dict):
             # YAML wins
-            merged.update({str(k): str(v) for k, v in existing.items()})
+            _update_as_str(merged, existing)
         data["variables"] = _yaml_map_from(merged)
 
     # Jobs
-    for key, node in list(data.items()):
-        if not isinstance(node, dict):
-            continue
-        # Heuristic: is a job (has script-ish keys) or an extends/template
-        is_job_like = any(k in node for k in ("script", "before_script", "after_script", "pre_get_sources_script"))
-        if not is_job_like:
+    for key, node, is_job in walked:
+        if not is_job:
             continue
         jvars = job_vars.get(key) or {}
         if not jvars:
             continue
         existing = node.get("variables")
-        merged: dict[str, str] = dict(jvars)
+        merged = dict(jvars)
         if isinstance(existing, dict):
-            merged.update({str(k): str(v) for k, v in existing.items()})
+            _update_as_str(merged, existing)
         node["variables"] = _yaml_map_from(merged)
 
 
 def extract_job_names_from_yaml(data) -> tuple[str, ...]:
-    names: list[str] = []
-    for key, node in list(data.items()):
-        if isinstance(node, dict) and any(
-            k in node for k in ("script", "before_script", "after_script", "pre_get_sources_script")
-        ):
-            names.append(key)
-    return tuple(names)
+    return tuple(key for key, _node, is_job in _walk_top_level(data) if is_job)
 
 
 # ------------------ CLI helpers ------------------
 
 
-def _load_yaml(path: Path):
+@lru_cache(maxsize=100)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int):
     from bash2yaml.utils.yaml_factory import get_yaml  # lazy import to use project's config
 
     yaml = get_yaml()
-    return yaml.load(path.read_text(encoding="utf-8"))
+    return yaml.load(Path(path_str).read_text(encoding="utf-8"))
+
+
+def _load_yaml(path: Path):
+    st = os.stat(path)
+    # Deep copy: merge_into_yaml/apply_inheritance_hints mutate the tree, the cached one must stay pristine
+    return copy.deepcopy(_load_yaml_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+_load_yaml.cache_clear = _load_yaml_cached.cache_clear  # type: ignore[attr-defined]
 
 
 def _collect_yaml_inline_vars_for_job(data, job: str) -> dict[str, str]:
@@ -220,8 +415,7 @@ def _collect_yaml_inline_vars_for_job(data, job: str) -> dict[str, str]:
     if not isinstance(vars_node, dict):
         return {}
     out: dict[str, str] = {}
-    for k, v in vars_node.items():
-        out[str(k)] = str(v)
+    _update_as_str(out, vars_node)
     return out
 
 
@@ -236,7 +430,7 @@ def load_file_and_job_variables(uncompiled_yaml: Path, job: str) -> tuple[dict[s
     # YAML wins
     yaml_top = data.get("variables")
     if isinstance(yaml_top, dict):
-        file_vars.update({str(k): str(v) for k, v in yaml_top.items()})
+        _update_as_str(file_vars, yaml_top)
 
     yaml_job = _collect_yaml_inline_vars_for_job(data, job)
     job_vars.update(yaml_job)
@@ -302,6 +496,25 @@ def add_cli_subcommands(subparsers) -> None:
 
 # -------------- Optional: inheritance hints --------------
 HINT_INHERIT_RE = re.compile(r"b2gl:inherit:variables\s*=\s*([^\s#]+)")
+# Literal prefix of HINT_INHERIT_RE; a substring test rules out nearly every comment before the regex runs
+_HINT_MARKER = "b2gl:inherit:variables"
+# ruamel.yaml.comments.Comment.attrib, spelled out so the hint scan doesn't import ruamel
+_RUAMEL_COMMENT_ATTR = "_yaml_comment"
+
+
+def _iter_comment_values(ca) -> Iterator[str]:
+    """Yield the comment strings ruamel keeps on a node, in the order they were always scanned."""
+    for attr in ("comment", "end", "items"):
+        val = getattr(ca, attr, None)
+        if not val:
+            continue
+        # val can be complex; collect strings we see
+        if isinstance(val, list):
+            for t in val:
+                if t and getattr(t, "value", None):
+                    yield t.value
+        elif getattr(val, "value", None):
+            yield val.value
 
 
 def apply_inheritance_hints(data) -> None:
@@ -311,29 +524,29 @@ def apply_inheritance_hints(data) -> None:
       # b2gl:inherit:variables=false
       # b2gl:inherit:variables=FOO,BAR
     """
-    for _key, node in list(data.items()):
-        if not isinstance(node, dict):
-            continue
-        # ruamel preserves comments in .ca; try both key/head comments
-        ca = getattr(node, "ca", None)
+    _apply_inheritance_hints_prewalked(_walk_top_level(data))
+
+
+def _apply_inheritance_hints_prewalked(walked: list[tuple[Any, dict, bool]]) -> None:
+    for _key, node, _is_job in walked:
+        # ruamel preserves comments in .ca; try both key/head comments. Read the backing
+        # attribute rather than the `.ca` property, which creates and attaches an empty
+        # Comment to every node that has none.
+        ca = getattr(node, _RUAMEL_COMMENT_ATTR, None)
         if not ca:
             continue
-        comments = []
-        for attr in ("comment", "end", "items"):
-            val = getattr(ca, attr, None)
-            if not val:
-                continue
-            # val can be complex; collect strings we see
-            if isinstance(val, list):
-                for t in val:
-                    if t and hasattr(t, "value"):
-                        comments.append(getattr(t, "value", ""))
-            elif hasattr(val, "value"):
-                comments.append(getattr(val, "value", ""))
-        blob = "\n".join(x or "" for x in comments)
-        m = HINT_INHERIT_RE.search(blob)
+        # Stop at the first comment carrying the marker; most nodes have none and never reach the regex.
+        # Matching per comment equals matching the joined comments: a hint can't span two, as each starts with '#'
+        m = None
+        for comment in _iter_comment_values(ca):
+            if _HINT_MARKER in comment:
+                m = HINT_INHERIT_RE.search(comment)
+                if m:
+                    break
         if not m:
             continue
+        from ruamel.yaml import CommentedMap  # lazy, only once a hint is found
+
         raw = m.group(1).strip()
         if raw.lower() == "false":
             node["inherit"] = CommentedMap({"variables": False})
@@ -351,7 +564,11 @@ def integrate_into_compiler(data, uncompiled_yaml_path: Path) -> None:
     It discovers jobs, loads file/job variables, merges them with YAML (YAML wins),
     and applies optional inheritance hints.
     """
-    jobs = extract_job_names_from_yaml(data)
+    # Walk the top level once and share it between discovery, merging and hints.
+    # merge may swap out the top-level `variables:` node; the stale entry only
+    # matters to the hint pass, and a fresh map carries no hint comments anyway.
+    walked = _walk_top_level(data)
+    jobs = tuple(key for key, _node, is_job in walked if is_job)
     bundle = discover_variables_files(uncompiled_yaml_path, jobs)
-    merge_into_yaml(data, bundle.file_level, bundle.job_level)
-    apply_inheritance_hints(data)
+    _merge_into_yaml_prewalked(data, walked, bundle.file_level, bundle.job_level)
+    _apply_inheritance_hints_prewalked(walked)